@@ -3,14 +3,18 @@ Application Manager - Central data controller
 """
 
 from pathlib import Path
-from PyQt5.QtCore import QObject, pyqtSignal, QUrl
+from PyQt5.QtCore import QObject, pyqtSignal, QUrl, QTimer
 from PyQt5.QtWidgets import QFileDialog, QWidget, QMessageBox
-from typing import List, Optional
+from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 from .data_models import (
     GlobalConfig,
     ProjectData,
     ImageData,
+    Tag,
     TagList,
     ImageList,
     PendingChanges,
@@ -20,6 +24,15 @@ from .config_manager import ConfigManager
 from .repository import FileSystemRepository, DatabaseRepository, CacheRepository
 from .database import Database
 
+# Quiet period before project_changed is emitted for mark_project_dirty
+PROJECT_CHANGED_DELAY_MS = 500
+
+# Shared pool for reading image JSON files; file reads release the GIL
+_IMAGE_DATA_IO_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="image-data-io",
+)
+
 
 class AppManager(QObject):
     """Central manager for application data and state"""
@@ -51,17 +64,41 @@ class AppManager(QObject):
         self.project_data = ProjectData()  # Keep for backward compatibility
 
         self.tag_list: TagList = TagList()
+        # Tag instance counts for the image list tag_list was last rebuilt from,
+        # so tag edits can update tag_list without rescanning every image
+        self._tag_counts: Optional[Counter] = None
+        self._tag_counts_source: Optional[ImageList] = None
         self.pending_changes = PendingChanges()
         self.filtered_view: Optional[ImageList] = None  # Filtered ImageList view
         self.current_filter_expression: str = ""  # Track current filter expression
         self._plugins_with_unsaved_changes = set()  # Track plugins with unsaved changes
 
+        # Coalesces project_changed for mark_project_dirty
+        self._project_changed_timer = QTimer(self)
+        self._project_changed_timer.setSingleShot(True)
+        self._project_changed_timer.setInterval(PROJECT_CHANGED_DELAY_MS)
+        self._project_changed_timer.timeout.connect(self._emit_deferred_project_changed)
+        self.project_change_deferred = False  # True while that emission runs
+
         # ImageData cache - prevents re-reading JSON files for recently accessed images
         self._image_data_cache = {}  # {image_path: ImageData}
         self._cache_max_size = (
             1000  # Keep up to 1000 most recently used images in cache
         )
 
+        # Lowercased tag -> images having it, for the image list it was built
+        # from; kept current by save_image_data and built lazily per image
+        self._tag_image_index: Dict[str, set] = {}
+        self._indexed_image_tags: Dict[Path, frozenset] = {}
+        self._tag_image_index_source: Optional[ImageList] = None
+
+        # Project-wide tag_str -> [representative Tag, occurrences, total count]
+        # for the image list it was built from, with the per-image counts it sums;
+        # kept current by save_image_data and filled by index_project_tags
+        self._project_tag_index: Dict[str, list] = {}
+        self._project_tag_image_counts: Dict[Path, Counter] = {}
+        self._project_tag_index_source: Optional[ImageList] = None
+
         # Repository instances (initialized when library is loaded)
         self.fs_repo: Optional[FileSystemRepository] = None
         self.db_repo: Optional[DatabaseRepository] = None
@@ -103,6 +140,15 @@ class AppManager(QObject):
         self.filtered_view = filtered_list
         self.project_changed.emit()
 
+    def set_filtered_paths(self, base_dir: Path, image_paths: List[Path]):
+        """Show only the given images, reusing the current filtered view if any"""
+        view = self.filtered_view
+        if view is not None and view._base_dir == base_dir:
+            view.update_filtered_paths(image_paths)
+        else:
+            self.filtered_view = ImageList.create_filtered(base_dir, image_paths)
+        self.project_changed.emit()
+
     def get_tag_list(self) -> TagList:
         """Get tag list"""
         return self.tag_list
@@ -146,7 +192,7 @@ class AppManager(QObject):
         self.filtered_view = None
 
         # Clear image data cache
-        self._image_data_cache.clear()
+        self._clear_image_data_cache()
 
         # Set view mode to library
         self.current_view_mode = "library"
@@ -291,7 +337,7 @@ class AppManager(QObject):
         # Clear state
         self.pending_changes.clear()
         self.filtered_view = None
-        self._image_data_cache.clear()
+        self._clear_image_data_cache()
         self.current_view_mode = "library"
         self.current_project = None
 
@@ -307,6 +353,7 @@ class AppManager(QObject):
 
         # Initialize tag list
         self.tag_list.clear()
+        self._tag_counts = None
 
         # Notify
         self.config_changed.emit()
@@ -380,8 +427,33 @@ class AppManager(QObject):
         if save:
             # Track project modification (deferred)
             self.pending_changes.mark_project_modified()
+        # This notification covers any still waiting from mark_project_dirty
+        self._project_changed_timer.stop()
         self.project_changed.emit()
 
+    def mark_project_dirty(self):
+        """Mark the project modified and notify once edits settle
+
+        For edits whose caller already updated its own views: project_changed
+        is emitted once, PROJECT_CHANGED_DELAY_MS after the last call, with
+        project_change_deferred set so that caller can skip reloading.
+        """
+        self.pending_changes.mark_project_modified()
+        self._project_changed_timer.start()
+
+    def flush_project_changed(self):
+        """Emit a project_changed still waiting from mark_project_dirty now"""
+        if self._project_changed_timer.isActive():
+            self._project_changed_timer.stop()
+            self._emit_deferred_project_changed()
+
+    def _emit_deferred_project_changed(self):
+        self.project_change_deferred = True
+        try:
+            self.project_changed.emit()
+        finally:
+            self.project_change_deferred = False
+
     def load_project(self, project_file: Path):
         """Load project from file"""
         # Determine library images directory to ensure correct relative path calculation
@@ -398,7 +470,7 @@ class AppManager(QObject):
         self.filtered_view = None
 
         # Clear image data cache (new project, old cache is invalid)
-        self._image_data_cache.clear()
+        self._clear_image_data_cache()
 
         # Add to recent projects
         project_path_str = str(project_file)
@@ -697,7 +769,7 @@ class AppManager(QObject):
             self.pending_changes.clear()
 
             # Clear image data cache to force reload from disk
-            self._image_data_cache.clear()
+            self._clear_image_data_cache()
 
             # If force reload, also refresh video metadata for everything in the view
             if force_reload:
@@ -807,15 +879,228 @@ class AppManager(QObject):
         if image_path in self._image_data_cache:
             return self._image_data_cache[image_path]
 
-        # Load from disk and cache - use current view
+        # Load from disk and cache
+        return self._cache_image_data(image_path, self._read_image_data(image_path))
+
+    def load_image_data_batch(
+        self, image_paths: List[Path], errors: Optional[Dict[Path, Exception]] = None
+    ) -> Dict[Path, ImageData]:
+        """Load image data for many images, reading uncached JSON files in parallel
+
+        Pending changes and cached entries are used as in load_image_data. Only
+        the file reads run on the I/O pool; caching happens on the calling thread.
+
+        Args:
+            image_paths: Images to load
+            errors: If given, images that fail to load are skipped and their
+                exception stored here; otherwise the first failure is raised
+
+        Returns:
+            Dict of image path -> ImageData, in image_paths order
+        """
+        modified_images = self.pending_changes.get_modified_images()
+        loaded = {}
+        misses = []
+        for image_path in image_paths:
+            if image_path in modified_images:
+                loaded[image_path] = modified_images[image_path]
+            elif image_path in self._image_data_cache:
+                loaded[image_path] = self._image_data_cache[image_path]
+            else:
+                loaded[image_path] = None
+                misses.append(image_path)
+
+        def read(image_path):
+            try:
+                return self._read_image_data(image_path)
+            except Exception as e:
+                return e
+
+        if len(misses) > 1:
+            results = _IMAGE_DATA_IO_POOL.map(read, misses)
+        else:
+            results = map(read, misses)
+
+        for image_path, image_data in zip(misses, results):
+            if isinstance(image_data, Exception):
+                if errors is None:
+                    raise image_data
+                errors[image_path] = image_data
+                del loaded[image_path]
+                continue
+            loaded[image_path] = self._cache_image_data(image_path, image_data)
+
+        return loaded
+
+    def _clear_image_data_cache(self):
+        """Drop cached image data and everything derived from it"""
+        self._image_data_cache.clear()
+        self._tag_image_index = {}
+        self._indexed_image_tags = {}
+        self._project_tag_index = {}
+        self._project_tag_image_counts = {}
+
+    def images_with_any_tag(self, tag_strs: List[str]) -> List[Path]:
+        """Images in the current view having any of the given tags
+
+        Tags are compared case-insensitively, as in filter expressions. Uses
+        an inverted tag index, so only images not indexed yet are loaded.
+
+        Args:
+            tag_strs: Full tags ("category:value")
+
+        Returns:
+            Matching image paths in view order
+        """
+        image_list = self.get_image_list()
+        if image_list is None:
+            return []
+        if image_list is not self._tag_image_index_source:
+            self._tag_image_index = {}
+            self._indexed_image_tags = {}
+            self._tag_image_index_source = image_list
+
+        image_paths = image_list.get_all_paths()
+        unindexed = [p for p in image_paths if p not in self._indexed_image_tags]
+        if unindexed:
+            errors = {}
+            for image_path, image_data in self.load_image_data_batch(
+                unindexed, errors
+            ).items():
+                self._index_image_tags(image_path, image_data)
+            for image_path, e in errors.items():
+                print(f"Error indexing tags of {image_path}: {e}")
+
+        matches = set()
+        for tag_str in tag_strs:
+            matches.update(self._tag_image_index.get(tag_str.lower(), ()))
+        return [p for p in image_paths if p in matches]
+
+    def _index_image_tags(self, image_path: Path, image_data: ImageData):
+        """Bring the tag index entries for one image up to date"""
+        new_tags = frozenset(tag_str.lower() for tag_str in image_data.tag_str_set)
+        old_tags = self._indexed_image_tags.get(image_path, frozenset())
+        for tag_str in old_tags - new_tags:
+            images = self._tag_image_index[tag_str]
+            images.discard(image_path)
+            if not images:
+                del self._tag_image_index[tag_str]
+        for tag_str in new_tags - old_tags:
+            self._tag_image_index.setdefault(tag_str, set()).add(image_path)
+        self._indexed_image_tags[image_path] = new_tags
+
+    @staticmethod
+    def count_image_tags(tags: List[Tag]):
+        """Count one image's tags for index_project_tags (safe on worker threads)
+
+        Returns:
+            Tuple of (Counter of tag_str -> copies in the image, dict of
+            tag_str -> first tag with that text)
+        """
+        counts = Counter()
+        first = {}
+        for tag in tags:
+            tag_str = f"{tag.category}:{tag.value}"
+            counts[tag_str] += 1
+            if tag_str not in first:
+                first[tag_str] = tag
+        return counts, first
+
+    def project_tags_to_index(self) -> List[Path]:
+        """Images of the current image list missing from the project tag index
+
+        Images no longer in the list are dropped from the index first.
+
+        Returns:
+            Image paths to count with count_image_tags, in view order
+        """
+        image_list = self.get_image_list()
+        if image_list is None:
+            return []
+        if image_list is not self._project_tag_index_source:
+            self._project_tag_index = {}
+            self._project_tag_image_counts = {}
+            self._project_tag_index_source = image_list
+
+        image_paths = image_list.get_all_paths()
+        if self._project_tag_image_counts:
+            current = set(image_paths)
+            removed = [p for p in self._project_tag_image_counts if p not in current]
+            for image_path in removed:
+                self._remove_project_tag_counts(image_path)
+        return [p for p in image_paths if p not in self._project_tag_image_counts]
+
+    def index_project_tags(self, image_list: ImageList, counted: Dict[Path, tuple]):
+        """Add counts from count_image_tags to the project tag index
+
+        Images saved since they were read are already indexed with their newer
+        tags and are skipped, as are counts for an image list no longer current.
+
+        Args:
+            image_list: Image list the counted images were read from
+            counted: Dict of image path -> count_image_tags result
+        """
+        if image_list is not self._project_tag_index_source:
+            return
+        for image_path, (counts, first) in counted.items():
+            if image_path not in self._project_tag_image_counts:
+                self._add_project_tag_counts(image_path, counts, first)
+
+    def get_project_tag_index(self) -> Dict[str, list]:
+        """Project-wide tag_str -> [representative Tag, occurrences, total count]
+
+        As in the tags table, each occurrence counts every copy in its image
+        towards the total. Only covers the images indexed so far (see
+        project_tags_to_index).
+        """
+        return self._project_tag_index
+
+    def _reindex_project_tags(self, image_path: Path, image_data: ImageData):
+        """Bring the project tag index up to date for one saved image"""
+        image_list = self._project_tag_index_source
+        if image_path in self._project_tag_image_counts:
+            self._remove_project_tag_counts(image_path)
+        if image_list is not None and image_list.get_index(image_path) is not None:
+            self._add_project_tag_counts(
+                image_path, *self.count_image_tags(image_data.tags)
+            )
+
+    def _add_project_tag_counts(self, image_path: Path, counts: Counter, first: dict):
+        """Add one image's tag counts to the project tag index"""
+        self._project_tag_image_counts[image_path] = counts
+        index = self._project_tag_index
+        for tag_str, copies in counts.items():
+            entry = index.get(tag_str)
+            if entry is None:
+                # A copy: image tags can be edited in place (spell check)
+                tag = first[tag_str]
+                entry = index[tag_str] = [Tag(tag.category, tag.value), 0, 0]
+            entry[1] += copies
+            # Each occurrence counts every copy in its image (including duplicates)
+            entry[2] += copies * copies
+
+    def _remove_project_tag_counts(self, image_path: Path):
+        """Remove one image's tag counts from the project tag index"""
+        index = self._project_tag_index
+        for tag_str, copies in self._project_tag_image_counts.pop(image_path).items():
+            entry = index[tag_str]
+            entry[1] -= copies
+            entry[2] -= copies * copies
+            if not entry[1]:
+                del index[tag_str]
+
+    def _read_image_data(self, image_path: Path) -> ImageData:
+        """Read image data from disk (safe to call from worker threads)"""
+        # Use current view
         image_list = self.get_image_list()
         if image_list is not None:
-            image_data = image_list.get_image_data(image_path)
-        else:
-            # Fallback to direct load
-            json_path = image_path.with_suffix(".json")
-            image_data = ImageData.load(json_path)
+            return image_list.get_image_data(image_path)
+        # Fallback to direct load
+        json_path = image_path.with_suffix(".json")
+        return ImageData.load(json_path)
 
+    def _cache_image_data(self, image_path: Path, image_data: ImageData) -> ImageData:
+        """Finish loading image data read from disk and add it to the cache"""
         # Ensure duration is in metadata for videos if not already there
         video_extensions = {
             ".mp4",
@@ -859,7 +1144,27 @@ class AppManager(QObject):
 
     def save_image_data(self, image_path: Path, image_data: ImageData):
         """Track image data changes (deferred save - does not write to disk)"""
-        # Auto-update caption if there's an active caption profile
+        self._save_image_data(image_path, image_data, self._caption_settings())
+
+    def save_image_data_batch(self, images: Dict[Path, ImageData]):
+        """Track changes to many images at once (deferred, like save_image_data)
+
+        The caption profile is looked up and parsed once for the whole batch.
+
+        Args:
+            images: Dict of image path -> changed ImageData
+        """
+        caption_settings = self._caption_settings()
+        for image_path, image_data in images.items():
+            self._save_image_data(image_path, image_data, caption_settings)
+
+    def _caption_settings(self):
+        """Parsed active caption profile for auto-captioning
+
+        Returns:
+            Tuple of (template_parts, remove_duplicates, max_tags), or None if
+            there is no active profile or it could not be parsed
+        """
         active_profile = None
 
         # Check for active caption profile in both library and project views
@@ -872,33 +1177,54 @@ class AppManager(QObject):
             # Project view - check project export settings
             active_profile = self.current_project.export.get("active_caption_profile")
 
-        if active_profile:
-            try:
-                from .utils import parse_export_template, apply_export_template
+        if not active_profile:
+            return None
 
-                template_parts = parse_export_template(active_profile)
+        try:
+            from .utils import parse_export_template
 
-                # Get caption profile settings (remove_duplicates, max_tags)
-                remove_duplicates = False
-                max_tags = None
+            template_parts = parse_export_template(active_profile)
 
-                if self.current_view_mode == "library" and self.current_library:
-                    remove_duplicates = getattr(
-                        self.current_library, "caption_profile_remove_duplicates", False
-                    )
-                    max_tags_val = getattr(
-                        self.current_library, "caption_profile_max_tags", 0
-                    )
-                    max_tags = max_tags_val if max_tags_val > 0 else None
-                elif self.current_view_mode == "project" and self.current_project:
-                    remove_duplicates = self.current_project.export.get(
-                        "caption_profile_remove_duplicates", False
-                    )
-                    max_tags_val = self.current_project.export.get(
-                        "caption_profile_max_tags", 0
-                    )
-                    max_tags = max_tags_val if max_tags_val > 0 else None
+            # Get caption profile settings (remove_duplicates, max_tags)
+            remove_duplicates = False
+            max_tags = None
+
+            if self.current_view_mode == "library" and self.current_library:
+                remove_duplicates = getattr(
+                    self.current_library, "caption_profile_remove_duplicates", False
+                )
+                max_tags_val = getattr(
+                    self.current_library, "caption_profile_max_tags", 0
+                )
+                max_tags = max_tags_val if max_tags_val > 0 else None
+            elif self.current_view_mode == "project" and self.current_project:
+                remove_duplicates = self.current_project.export.get(
+                    "caption_profile_remove_duplicates", False
+                )
+                max_tags_val = self.current_project.export.get(
+                    "caption_profile_max_tags", 0
+                )
+                max_tags = max_tags_val if max_tags_val > 0 else None
+        except Exception as e:
+            # Silently fail if caption generation fails
+            print(f"Error auto-generating caption: {e}")
+            return None
+
+        return template_parts, remove_duplicates, max_tags
+
+    def _save_image_data(
+        self, image_path: Path, image_data: ImageData, caption_settings
+    ):
+        """Track one image change, auto-captioning with _caption_settings()"""
+        # Tags may have been edited in place
+        image_data.invalidate_tag_cache()
+
+        # Auto-update caption if there's an active caption profile
+        if caption_settings:
+            try:
+                from .utils import apply_export_template
 
+                template_parts, remove_duplicates, max_tags = caption_settings
                 caption = apply_export_template(
                     template_parts,
                     image_data,
@@ -912,6 +1238,9 @@ class AppManager(QObject):
 
         # Track the change
         self.pending_changes.mark_image_modified(image_path, image_data)
+        if image_path in self._indexed_image_tags:
+            self._index_image_tags(image_path, image_data)
+        self._reindex_project_tags(image_path, image_data)
 
         # Emit signal that image data has changed (for caption updates)
         self.image_data_changed.emit(image_path)
@@ -920,6 +1249,15 @@ class AppManager(QObject):
         for tag in image_data.tags:
             self.tag_list.add_tag(tag.category, tag.value)
 
+    def get_loaded_image_data(self) -> Dict[Path, ImageData]:
+        """Image data already in memory, keyed by path
+
+        Pending changes take priority over cached data, as in load_image_data.
+        """
+        loaded = dict(self._image_data_cache)
+        loaded.update(self.pending_changes.get_modified_images())
+        return loaded
+
     def get_all_tags_in_project(self) -> List[str]:
         """Get all tags for fuzzy search (for backward compatibility)"""
         return self.tag_list.get_all_tags()
@@ -927,7 +1265,9 @@ class AppManager(QObject):
     def rebuild_tag_list(self):
         """Rebuild the tag list from all images in the current view (including pending changes)"""
         self.tag_list.clear()
+        self._tag_counts = Counter()
         image_list = self.get_image_list()
+        self._tag_counts_source = image_list
         if image_list is not None:
             for img_path in image_list:
                 img_data = self.load_image_data(
@@ -935,6 +1275,40 @@ class AppManager(QObject):
                 )  # Uses pending changes if available
                 for tag in img_data.tags:
                     self.tag_list.add_tag(tag.category, tag.value)
+                    self._tag_counts[str(tag)] += 1
+
+    def apply_tag_changes(self, removed_tags: List[Tag], added_tags: List[Tag]):
+        """Update the tag list after tags were removed from or added to images
+
+        Each entry is one tag instance removed or added (already saved with
+        save_image_data). A tag leaves the tag list once no image in the view
+        uses it. Falls back to rebuild_tag_list if the counts from the last
+        rebuild are not for the current view.
+        """
+        image_list = self.get_image_list()
+        if self._tag_counts is None or image_list is not self._tag_counts_source:
+            self.rebuild_tag_list()
+            return
+
+        for tag in added_tags:
+            self._tag_counts[str(tag)] += 1
+            self.tag_list.add_tag(tag.category, tag.value)
+
+        for tag in removed_tags:
+            tag_str = str(tag)
+            self._tag_counts[tag_str] -= 1
+            if self._tag_counts[tag_str] > 0:
+                continue
+            # Other code may have changed tags without updating the counts,
+            # so confirm the tag is really gone before dropping it
+            if image_list is not None and any(
+                tag_str in self.load_image_data(img_path).tag_str_set
+                for img_path in image_list
+            ):
+                self._tag_counts[tag_str] = 1
+            else:
+                del self._tag_counts[tag_str]
+                self.tag_list.remove_tag(tag.category, tag.value)
 
     def remove_images_from_project(self, image_paths: List[Path]) -> int:
         """
@@ -2,8 +2,10 @@
 Shared data models used across the application
 """
 
+from bisect import insort
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
@@ -100,12 +102,93 @@ class MediaData:
 
     def add_tag(self, category: str, value: str):
         """Add a tag to the image"""
-        self.tags.append(Tag(category=category, value=value))
+        tag = Tag(category=category, value=value)
+        self.tags.append(tag)
+        tag_str = f"{category}:{value}"
+        tag_str_set = self.__dict__.get("_tag_str_set")
+        if tag_str_set is not None:
+            tag_str_set.add(tag_str)
+        tag_by_str = self.__dict__.get("_tag_by_str")
+        if tag_by_str is not None:
+            tag_by_str.setdefault(tag_str, tag)
+        tag_positions = self.__dict__.get("_tag_positions")
+        if tag_positions is not None:
+            tag_positions.setdefault((category, value), []).append(len(self.tags) - 1)
+
+    def remove_tag(self, tag: Tag) -> bool:
+        """Remove the first matching tag from the image
 
-    def remove_tag(self, tag: Tag):
-        """Remove a tag from the image"""
-        if tag in self.tags:
+        Returns:
+            True if a tag was removed
+        """
+        try:
             self.tags.remove(tag)
+        except ValueError:
+            return False
+        # A duplicate may remain and positions shift, so rebuild on next access
+        self.invalidate_tag_cache()
+        return True
+
+    def replace_tag(self, old_tag: Tag, new_tag: Tag) -> bool:
+        """Replace the first tag equal to old_tag with new_tag, keeping its position
+
+        Uses a cached (category, value) -> positions index, so repeated
+        replacements on the same image do not rescan the tag list.
+
+        Returns:
+            True if old_tag was found and replaced
+        """
+        tag_positions = self.__dict__.get("_tag_positions")
+        if tag_positions is None:
+            tag_positions = {}
+            for i, tag in enumerate(self.tags):
+                tag_positions.setdefault((tag.category, tag.value), []).append(i)
+            self._tag_positions = tag_positions
+
+        old_key = (old_tag.category, old_tag.value)
+        positions = tag_positions.get(old_key)
+        if not positions:
+            return False
+
+        idx = positions.pop(0)
+        if not positions:
+            del tag_positions[old_key]
+        self.tags[idx] = new_tag
+        insort(tag_positions.setdefault((new_tag.category, new_tag.value), []), idx)
+
+        # String lookups depend on which tags remain, so rebuild on next access
+        self._tag_str_set = None
+        self._tag_by_str = None
+        return True
+
+    @property
+    def tag_str_set(self) -> Set[str]:
+        """Set of "category:value" strings of the tags (cached, do not modify)
+
+        Kept current by add_tag/remove_tag. Code that edits self.tags directly
+        must call invalidate_tag_cache(); AppManager.save_image_data does so.
+        """
+        tag_str_set = self.__dict__.get("_tag_str_set")
+        if tag_str_set is None:
+            tag_str_set = {str(tag) for tag in self.tags}
+            self._tag_str_set = tag_str_set
+        return tag_str_set
+
+    def find_tag(self, tag_str: str) -> Optional[Tag]:
+        """First tag whose "category:value" string is tag_str, or None (cached)"""
+        tag_by_str = self.__dict__.get("_tag_by_str")
+        if tag_by_str is None:
+            tag_by_str = {}
+            for tag in self.tags:
+                tag_by_str.setdefault(str(tag), tag)
+            self._tag_by_str = tag_by_str
+        return tag_by_str.get(tag_str)
+
+    def invalidate_tag_cache(self):
+        """Drop cached tag lookups after self.tags was edited directly"""
+        self._tag_str_set = None
+        self._tag_by_str = None
+        self._tag_positions = None
 
     def get_tags_by_category(self, category: str) -> List[Tag]:
         """Get all tags of a specific category"""
@@ -701,24 +784,24 @@ class TagList:
     def __init__(self):
         self._tags: set = set()  # Full tags "category:value"
         self._categories: set = set()  # Just categories "category:"
+        self._category_counts: Counter = Counter()  # "category:" -> distinct tags
         self._sorted_tags: List[str] = []  # Pre-sorted for fuzzy search
         self._sorted_categories: List[str] = []  # Pre-sorted categories
+        self._sorted_dirty: bool = False  # Sorted lists are rebuilt on next read
+        # Bumped on every change, so callers can skip unchanged tag lists
+        self.version: int = 0
 
     def add_tag(self, category: str, value: str):
         """Add a tag and update sorted lists"""
         tag_str = f"{category}:{value}"
-        cat_str = f"{category}:"
-
-        # Add to sets
-        tags_changed = tag_str not in self._tags
-        cats_changed = cat_str not in self._categories
+        if tag_str in self._tags:
+            return
 
+        cat_str = f"{category}:"
         self._tags.add(tag_str)
         self._categories.add(cat_str)
-
-        # Rebuild sorted lists if needed
-        if tags_changed or cats_changed:
-            self._rebuild_sorted_lists()
+        self._category_counts[cat_str] += 1
+        self._changed()
 
     def remove_tag(self, category: str, value: str):
         """Remove a tag and update sorted lists"""
@@ -726,7 +809,13 @@ class TagList:
 
         if tag_str in self._tags:
             self._tags.discard(tag_str)
-            self._rebuild_sorted_lists()
+            # Drop the category too once no remaining tag uses it
+            cat_str = f"{category}:"
+            self._category_counts[cat_str] -= 1
+            if self._category_counts[cat_str] <= 0:
+                del self._category_counts[cat_str]
+                self._categories.discard(cat_str)
+            self._changed()
 
     def has_tag(self, category: str, value: str) -> bool:
         """Check if tag exists"""
@@ -734,22 +823,28 @@ class TagList:
 
     def get_all_tags(self) -> List[str]:
         """Get all tags sorted (categories first, then full tags)"""
+        self._ensure_sorted()
         return self._sorted_categories + self._sorted_tags
 
     def get_all_categories(self) -> List[str]:
         """Get all categories sorted"""
+        self._ensure_sorted()
         return self._sorted_categories.copy()
 
     def get_all_full_tags(self) -> List[str]:
         """Get all full tags (category:value) sorted"""
+        self._ensure_sorted()
         return self._sorted_tags.copy()
 
     def clear(self):
         """Clear all tags"""
         self._tags.clear()
         self._categories.clear()
+        self._category_counts.clear()
         self._sorted_tags.clear()
         self._sorted_categories.clear()
+        self._sorted_dirty = False
+        self.version += 1
 
     def build_from_imagelist(self, image_list: "ImageList"):
         """Build tag list by scanning all images in the ImageList"""
@@ -759,6 +854,17 @@ class TagList:
             for tag in img_data.tags:
                 self.add_tag(tag.category, tag.value)
 
+    def _changed(self):
+        """Record a change; sorting waits until the lists are read"""
+        self._sorted_dirty = True
+        self.version += 1
+
+    def _ensure_sorted(self):
+        """Rebuild the sorted lists if tags changed since the last read"""
+        if self._sorted_dirty:
+            self._rebuild_sorted_lists()
+            self._sorted_dirty = False
+
     def _rebuild_sorted_lists(self):
         """Rebuild sorted lists from sets"""
         self._sorted_categories = sorted(list(self._categories))
@@ -775,6 +881,8 @@ class ImageList(QObject):
         super().__init__()
         self._base_dir: Path = base_dir
         self._image_paths: List[Path] = []  # Absolute paths
+        # Position of each path in _image_paths, built on first lookup
+        self._index_by_path: Optional[Dict[Path, int]] = None
         self._image_repeats: Dict[
             Path, int
         ] = {}  # Repeat count for each image (for dataset balancing)
@@ -786,7 +894,8 @@ class ImageList(QObject):
 
     def add_image(self, image_path: Path) -> bool:
         """Add image to list if not already present"""
-        if image_path not in self._image_paths:
+        if self.get_index(image_path) is None:
+            self._index_by_path[image_path] = len(self._image_paths)
             self._image_paths.append(image_path)
             self._image_repeats[image_path] = 1  # Initialize repeat count to 1
             self._dirty = True
@@ -795,8 +904,10 @@ class ImageList(QObject):
 
     def remove_image(self, image_path: Path) -> bool:
         """Remove image from list"""
-        if image_path in self._image_paths:
-            self._image_paths.remove(image_path)
+        idx = self.get_index(image_path)
+        if idx is not None:
+            del self._image_paths[idx]
+            self._index_by_path = None
             # Clean up repeat data
             if image_path in self._image_repeats:
                 del self._image_repeats[image_path]
@@ -851,12 +962,14 @@ class ImageList(QObject):
         Returns:
             True if path was updated, False if old_path not found
         """
-        if old_path not in self._image_paths:
+        idx = self.get_index(old_path)
+        if idx is None:
             return False
 
         # Update path in image list
-        idx = self._image_paths.index(old_path)
         self._image_paths[idx] = new_path
+        del self._index_by_path[old_path]
+        self._index_by_path[new_path] = idx
 
         # Update repeat data
         if old_path in self._image_repeats:
@@ -879,7 +992,10 @@ class ImageList(QObject):
     # Selection methods
     def select(self, image_path: Path):
         """Select an image"""
-        if image_path in self._image_paths and image_path not in self._selected_images:
+        if (
+            self.get_index(image_path) is not None
+            and image_path not in self._selected_images
+        ):
             self._selected_images.append(image_path)
 
     def deselect(self, image_path: Path):
@@ -891,7 +1007,7 @@ class ImageList(QObject):
         """Toggle selection of an image"""
         if image_path in self._selected_images:
             self._selected_images.remove(image_path)
-        elif image_path in self._image_paths:
+        elif self.get_index(image_path) is not None:
             self._selected_images.append(image_path)
 
     def select_all(self):
@@ -908,7 +1024,7 @@ class ImageList(QObject):
 
     def set_active(self, image_path: Path):
         """Set the active (focused) image"""
-        if image_path in self._image_paths:
+        if self.get_index(image_path) is not None:
             self._active_image = image_path
             self.active_changed.emit(image_path)
 
@@ -928,6 +1044,14 @@ class ImageList(QObject):
         """Get all image paths"""
         return self._image_paths.copy()
 
+    def get_index(self, image_path: Path) -> Optional[int]:
+        """Get the position of an image in the list, or None if not present"""
+        if self._index_by_path is None:
+            self._index_by_path = {
+                path: idx for idx, path in enumerate(self._image_paths)
+            }
+        return self._index_by_path.get(image_path)
+
     def get_image_data(self, image_path: Path) -> ImageData:
         """Load image data from JSON file"""
         json_path = self._get_json_path(image_path)
@@ -940,7 +1064,7 @@ class ImageList(QObject):
 
     def set_repeat(self, image_path: Path, repeat_count: int):
         """Set the repeat count for an image (for dataset balancing)"""
-        if image_path in self._image_paths:
+        if self.get_index(image_path) is not None:
             self._image_repeats[image_path] = (
                 repeat_count  # Allow any value including 0
             )
@@ -964,6 +1088,7 @@ class ImageList(QObject):
 
         # Update the image paths order
         self._image_paths = valid_ordered_paths
+        self._index_by_path = None
         self._dirty = True
         return True
 
@@ -1019,6 +1144,28 @@ class ImageList(QObject):
         image_list._dirty = False
         return image_list
 
+    def update_filtered_paths(self, image_paths: List[Path]):
+        """
+        Replace the images of a filtered view in place
+
+        Selection and the active image are kept where they are still in the
+        view. Like create_filtered, this does not mark the list dirty.
+
+        Args:
+            image_paths: New subset of image paths, in view order
+        """
+        self._image_paths = list(dict.fromkeys(image_paths))
+        self._image_repeats = {img_path: 1 for img_path in self._image_paths}
+        self._index_by_path = None
+        self._selected_images = [
+            img_path
+            for img_path in self._selected_images
+            if self.get_index(img_path) is not None
+        ]
+        if self._active_image is not None:
+            if self.get_index(self._active_image) is None:
+                self._active_image = None
+
     def is_dirty(self) -> bool:
         """Check if there are unsaved changes"""
         return self._dirty
@@ -1079,6 +1226,10 @@ class ImageList(QObject):
         """Return number of images"""
         return len(self._image_paths)
 
+    def __getitem__(self, index: int) -> Path:
+        """Get the image path at a position"""
+        return self._image_paths[index]
+
     def __iter__(self):
         """Allow iteration over image paths"""
         return iter(self._image_paths)
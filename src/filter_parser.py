@@ -8,8 +8,11 @@ Supports:
 - Parentheses for grouping: (class:lake OR class:river) AND NOT meta:deleted
 - Quoted strings: "class:big lake" for tags with spaces
 """
-from typing import List, Set
-from fnmatch import fnmatch
+from typing import Callable, List, Optional, Set
+from fnmatch import fnmatch, translate
+from functools import lru_cache
+import os
+import re
 from pyparsing import (
     Word, alphanums, alphas, Keyword, Group, Forward,
     QuotedString, Suppress, opAssoc, infixNotation,
@@ -213,6 +216,149 @@ def parse_filter(expression: str) -> FilterNode:
     return _parser.parse(expression)
 
 
+def constant_result(node: FilterNode) -> Optional[bool]:
+    """
+    Result of a filter tree that does not depend on which tags are present
+
+    Only meaningful for non-empty tag lists: a bare "*" pattern matches any
+    tag, so it is constant True there (but False for an empty list).
+
+    Args:
+        node: Root FilterNode of the expression tree
+
+    Returns:
+        True or False if every non-empty tag list gives that result,
+        None if the result depends on the tags
+    """
+    if isinstance(node, TagPattern):
+        if node.pattern and not node.pattern.strip("*"):
+            return True
+        return None
+
+    if isinstance(node, NotNode):
+        operand = constant_result(node.operand)
+        return None if operand is None else not operand
+
+    if isinstance(node, AndNode):
+        left = constant_result(node.left)
+        right = constant_result(node.right)
+        if left is False or right is False:
+            return False
+        if left is True and right is True:
+            return True
+        return None
+
+    if isinstance(node, OrNode):
+        left = constant_result(node.left)
+        right = constant_result(node.right)
+        if left is True or right is True:
+            return True
+        if left is False and right is False:
+            return False
+        return None
+
+    return None
+
+
+def literal_alternatives(node: FilterNode) -> Optional[List[str]]:
+    """
+    Tags of a filter tree that only ORs together exact tag patterns
+
+    Such an expression matches exactly the tag lists that contain one of
+    these tags (compared case-insensitively), so it can be answered from a
+    tag index instead of testing every tag list.
+
+    Args:
+        node: Root FilterNode of the expression tree
+
+    Returns:
+        Lowercased tags, or None if the tree has any other shape
+    """
+    if isinstance(node, TagPattern):
+        if "*" in node.pattern:
+            return None
+        return [node.pattern.lower()]
+
+    if isinstance(node, OrNode):
+        left = literal_alternatives(node.left)
+        if left is None:
+            return None
+        right = literal_alternatives(node.right)
+        if right is None:
+            return None
+        return left + right
+
+    return None
+
+
+def _compile_node(node: FilterNode, namespace: dict) -> str:
+    """
+    Python source for one tree node, evaluated against lowercased tags
+
+    Patterns are bound in namespace and only referenced by name, so tag
+    text never becomes part of the generated source.
+    """
+    if isinstance(node, TagPattern):
+        pattern_lower = node.pattern.lower()
+        name = f"_p{len(namespace)}"
+        if "*" not in pattern_lower:
+            # Exact match
+            namespace[name] = pattern_lower
+            return f"({name} in tags)"
+        # Wildcard match, same rules as fnmatch (including os.path.normcase)
+        namespace[name] = re.compile(translate(os.path.normcase(pattern_lower))).match
+        return f"any({name}(normcase(tag)) for tag in tags)"
+
+    if isinstance(node, NotNode):
+        return f"(not {_compile_node(node.operand, namespace)})"
+
+    if isinstance(node, AndNode):
+        left = _compile_node(node.left, namespace)
+        right = _compile_node(node.right, namespace)
+        return f"({left} and {right})"
+
+    if isinstance(node, OrNode):
+        left = _compile_node(node.left, namespace)
+        right = _compile_node(node.right, namespace)
+        return f"({left} or {right})"
+
+    # Unknown node type - fall back to its own evaluation
+    name = f"_p{len(namespace)}"
+    namespace[name] = node.evaluate
+    return f"{name}(tags)"
+
+
+@lru_cache(maxsize=128)
+def compile_filter(expression: str) -> Callable[[List[str]], bool]:
+    """
+    Parse a filter expression once into a reusable predicate
+
+    The tree is turned into a single generated Python function with patterns
+    lowercased up front, so each call lowercases the tags once and walks no
+    parse tree. Compiled predicates are cached per expression.
+
+    Args:
+        expression: Filter expression string
+
+    Returns:
+        Callable taking a list of tag strings and returning True if they
+        match the expression
+
+    Raises:
+        ValueError: If expression is invalid
+    """
+    namespace = {}
+    body = _compile_node(parse_filter(expression), namespace)
+    namespace["normcase"] = os.path.normcase
+    source = (
+        "def predicate(tags):\n"
+        "    tags = [tag.lower() for tag in tags]\n"
+        f"    return bool({body})\n"
+    )
+    exec(source, namespace)
+    return namespace["predicate"]
+
+
 def evaluate_filter(expression: str, tags: List[str]) -> bool:
     """
     Evaluate a filter expression against a list of tags
@@ -224,4 +370,4 @@ def evaluate_filter(expression: str, tags: List[str]) -> bool:
     Returns:
         True if tags match the expression, False otherwise
     """
-    return _parser.evaluate(expression, tags)
+    return compile_filter(expression)(tags)
@@ -0,0 +1,114 @@
+"""
+Compiled fuzzy matching kernels (optional, requires numba)
+
+Imported lazily by utils.fuzzy_search; if numba or numpy is missing the
+import fails and the pure-Python scorer is used instead.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+def encode_strings(strings):
+    """
+    Pack strings into one contiguous code point buffer
+
+    Args:
+        strings: List of strings
+
+    Returns:
+        Tuple of (uint32 buffer, int32 offsets) where string i occupies
+        buffer[offsets[i]:offsets[i + 1]]
+    """
+    buf = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32)
+    offsets = np.zeros(len(strings) + 1, dtype=np.int32)
+    np.cumsum([len(s) for s in strings], out=offsets[1:])
+    return buf, offsets
+
+
+def similarities(packed, query, min_ratio):
+    """
+    Similarity of query against every packed string
+
+    Args:
+        packed: (buffer, offsets) tuple from encode_strings
+        query: Query string
+        min_ratio: Similarities below this are reported as 0.0
+
+    Returns:
+        float64 array with one similarity per string
+    """
+    buf, offsets = packed
+    out = np.empty(len(offsets) - 1, dtype=np.float64)
+    encoded = np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32)
+    score_all(buf, offsets, encoded, min_ratio, out)
+    return out
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def score_all(buf, offsets, query, min_ratio, out):
+    """
+    Levenshtein similarity (1 - dist / longest) of query against every string
+
+    Each string gets its own edit budget from min_ratio and only the Ukkonen
+    band around the diagonal is computed. out[i] receives the similarity, or
+    0.0 if it is below min_ratio. Runs without the GIL so the UI thread stays
+    responsive while a suggestion worker is scoring.
+    """
+    n = query.shape[0]
+    for t in prange(offsets.shape[0] - 1):
+        start = offsets[t]
+        m = offsets[t + 1] - start
+        longest = max(n, m)
+        if longest == 0:
+            out[t] = 1.0
+            continue
+
+        k = int((1.0 - min_ratio) * longest + 1e-9)
+        limit = k + 1
+        if abs(n - m) > k:
+            out[t] = 0.0
+            continue
+
+        prev = np.empty(m + 1, dtype=np.int32)
+        curr = np.empty(m + 1, dtype=np.int32)
+        for j in range(m + 1):
+            prev[j] = j if j <= k else limit
+
+        exceeded = False
+        for i in range(1, n + 1):
+            ca = query[i - 1]
+            lo = i - k if i > k else 1
+            hi = i + k if i + k < m else m
+
+            left = i if lo == 1 else limit
+            curr[lo - 1] = left
+            row_min = left
+            diag = prev[lo - 1]
+
+            for j in range(lo, hi + 1):
+                above = prev[j]
+                best = diag + (1 if ca != buf[start + j - 1] else 0)
+                if above + 1 < best:
+                    best = above + 1
+                if left + 1 < best:
+                    best = left + 1
+                curr[j] = best
+                left = best
+                diag = above
+                if best < row_min:
+                    row_min = best
+
+            if hi < m:
+                curr[hi + 1] = limit
+
+            if row_min > k:
+                exceeded = True
+                break
+
+            prev, curr = curr, prev
+
+        if exceeded or prev[m] > k:
+            out[t] = 0.0
+        else:
+            out[t] = 1.0 - prev[m] / longest
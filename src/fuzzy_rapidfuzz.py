@@ -0,0 +1,68 @@
+"""
+RapidFuzz fuzzy matching backend (optional, requires rapidfuzz)
+
+Same interface as fuzzy_kernel. Imported lazily by utils.fuzzy_search and
+preferred over the numba kernel; if rapidfuzz or numpy is missing the import
+fails and the next backend is used instead.
+"""
+
+import numpy as np
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
+
+
+def encode_strings(strings):
+    """
+    Prepare strings for similarities
+
+    Args:
+        strings: List of strings
+
+    Returns:
+        Tuple of (list of strings, int64 array of their lengths)
+    """
+    strings = list(strings)
+    return strings, np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+
+
+def similarities(packed, query, min_ratio):
+    """
+    Similarity of query against every packed string
+
+    Distances come from RapidFuzz; the per-string edit budget and the
+    similarity (1 - dist / longest) are computed exactly as in fuzzy_kernel,
+    so both backends agree on ratios at the min_ratio boundary.
+
+    Args:
+        packed: (strings, lengths) tuple from encode_strings
+        query: Query string
+        min_ratio: Similarities below this are reported as 0.0
+
+    Returns:
+        float64 array with one similarity per string
+    """
+    strings, lengths = packed
+    if not strings:
+        return np.zeros(0, dtype=np.float64)
+
+    longest = np.maximum(lengths, len(query))
+    budgets = ((1.0 - min_ratio) * longest + 1e-9).astype(np.int64)
+
+    # Distances above the largest budget are reported as budget + 1, which
+    # lets RapidFuzz stop early; cdist runs in C with the GIL released
+    dists = cdist(
+        [query],
+        strings,
+        scorer=Levenshtein.distance,
+        score_cutoff=max(int(budgets.max()), 0),
+        dtype=np.int64,
+        workers=-1,
+    )[0]
+
+    out = np.zeros(len(strings), dtype=np.float64)
+    within = dists <= budgets
+    nonempty = longest > 0
+    hit = within & nonempty
+    out[hit] = 1.0 - dists[hit] / longest[hit]
+    out[~nonempty] = 1.0
+    return out
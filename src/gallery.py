@@ -1823,13 +1823,10 @@ class Gallery(QWidget):
                         print(f"ERROR: Error filtering image {img_path}: {e}")
                         continue
 
-                # Create filtered view
-                from .data_models import ImageList
-
+                # Update filtered view
                 base_dir = image_list._base_dir
                 if base_dir and filtered:
-                    filtered_view = ImageList.create_filtered(base_dir, filtered)
-                    self.app_manager.set_filtered_view(filtered_view)
+                    self.app_manager.set_filtered_paths(base_dir, filtered)
                     self.app_manager.current_filter_expression = default_filter
                     print(
                         f"[DEBUG] Applied default filter, {len(filtered)} images match"
@@ -666,6 +666,9 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle close event - check for unsaved changes, close all child windows"""
+        # Deliver any project_changed still waiting from recent tag edits
+        self.app_manager.flush_project_changed()
+
         # Check for unsaved changes
         if not self.app_manager.confirm_save_if_needed(self, "closing"):
             event.ignore()
@@ -985,9 +985,8 @@ class ModelTaggingPlugin(PluginWindow):
 
             # Remove existing tags in this category if not keeping
             if not keep_existing:
-                tags_to_remove = [tag for tag in img_data.tags if tag.category == category]
-                for tag in tags_to_remove:
-                    img_data.remove_tag(tag)
+                img_data.tags = [tag for tag in img_data.tags if tag.category != category]
+                img_data.invalidate_tag_cache()
 
             # Add new tags
             if split_caption:
@@ -318,17 +318,8 @@ class DatabaseRepository:
                 print(f"Error upserting media record {media_hash}: {e}")
                 raise
 
-            # 4. Update tags
-            cursor.execute("DELETE FROM tags WHERE media_hash = ?", (media_hash,))
-            for i, tag in enumerate(data.tags):
-                try:
-                    cursor.execute(
-                        "INSERT INTO tags (media_hash, category, value, position) VALUES (?, ?, ?, ?)",
-                        (media_hash, tag.category, tag.value, i),
-                    )
-                except sqlite3.Error as e:
-                    print(f"Error inserting tag {tag} for {media_hash}: {e}")
-                    raise
+            # 4. Update tags (only the rows that changed)
+            self._write_tags(cursor, media_hash, data.tags)
 
             # 5. Update relationships
             cursor.execute(
@@ -355,76 +346,58 @@ class DatabaseRepository:
                         raise
 
             self.db.conn.commit()
+            return True
 
-            # Upsert media record using a pattern that avoids DELETE+INSERT (REPLACE)
-            # which would trigger CASCADE DELETEs on relationships pointing TO this media.
-            cursor.execute(
-                """
-                INSERT INTO media (hash, type, source_media, name, caption, created, modified, metadata_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(hash) DO UPDATE SET
-                    type=excluded.type,
-                    source_media=excluded.source_media,
-                    name=excluded.name,
-                    caption=excluded.caption,
-                    modified=excluded.modified,
-                    metadata_json=excluded.metadata_json
-            """,
-                (
-                    media_hash,
-                    data.type,
-                    source_media,
-                    data.name,
-                    data.caption,
-                    now,  # This will be used only if it's a new insert
-                    now,
-                    metadata_json,
-                ),
-            )
-
-            # Delete existing tags and re-insert
-            cursor.execute("DELETE FROM tags WHERE media_hash = ?", (media_hash,))
+        except Exception as e:
+            print(f"Error upserting media {media_hash}: {e}")
+            if self.db and self.db.conn:
+                self.db.conn.rollback()
+            return False
 
-            # Insert tags
-            for i, tag in enumerate(data.tags):
-                cursor.execute(
-                    """
-                    INSERT INTO tags (media_hash, category, value, position)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (media_hash, tag.category, tag.value, i),
-                )
+    def _write_tags(self, cursor, media_hash: str, tags: List[Tag]):
+        """
+        Bring the tag rows of a media item in line with its tag list
 
-            # Update relationships
-            # Delete existing relationships from this media
-            cursor.execute(
-                "DELETE FROM relationships WHERE from_hash = ?", (media_hash,)
-            )
+        Rows are compared by position, so editing one tag updates one row
+        instead of deleting and re-inserting every tag of the item.
 
-            # Insert relationships from related dict
-            for rel_type, related_hashes in data.related.items():
-                for related_hash in related_hashes:
-                    # Determine strength (for similarity relationships)
-                    strength = (
-                        None  # Could be enhanced to store actual similarity scores
-                    )
+        Args:
+            cursor: Cursor of the open transaction
+            media_hash: Hash identifier
+            tags: Tags in order
+        """
+        cursor.execute(
+            "SELECT id, category, value, position FROM tags"
+            " WHERE media_hash = ? ORDER BY position, id",
+            (media_hash,),
+        )
+        rows = cursor.fetchall()
 
+        for i, tag in enumerate(tags):
+            try:
+                if i < len(rows):
+                    row_id, category, value, position = rows[i]
+                    if (category, value, position) != (tag.category, tag.value, i):
+                        cursor.execute(
+                            "UPDATE tags SET category = ?, value = ?, position = ?"
+                            " WHERE id = ?",
+                            (tag.category, tag.value, i, row_id),
+                        )
+                else:
                     cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO relationships (from_hash, to_hash, type, strength)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        (media_hash, related_hash, rel_type, strength),
+                        "INSERT INTO tags (media_hash, category, value, position)"
+                        " VALUES (?, ?, ?, ?)",
+                        (media_hash, tag.category, tag.value, i),
                     )
+            except sqlite3.Error as e:
+                print(f"Error writing tag {tag} for {media_hash}: {e}")
+                raise
 
-            self.db.conn.commit()
-            return True
-
-        except Exception as e:
-            print(f"Error upserting media {media_hash}: {e}")
-            if self.db and self.db.conn:
-                self.db.conn.rollback()
-            return False
+        if len(rows) > len(tags):
+            cursor.executemany(
+                "DELETE FROM tags WHERE id = ?",
+                [(row[0],) for row in rows[len(tags) :]],
+            )
 
     def load_media(self, media_hash: str) -> Optional[MediaData]:
         """
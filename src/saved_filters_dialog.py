@@ -243,12 +243,10 @@ class SavedFiltersDialog(QDialog):
             self.result_label.setText(f"{len(filtered)} images match")
             self.result_label.setStyleSheet("color: #5cb85c; font-style: italic;")  # Green
 
-        # Create filtered ImageList view
-        from .data_models import ImageList
+        # Update filtered ImageList view
         base_dir = image_list._base_dir
         if base_dir:
-            filtered_view = ImageList.create_filtered(base_dir, filtered)
-            self.app_manager.set_filtered_view(filtered_view)
+            self.app_manager.set_filtered_paths(base_dir, filtered)
             self.app_manager.current_filter_expression = filter_text
 
         # Close dialog after applying filter
@@ -2,7 +2,7 @@
 Tag Entry Widget - Reusable component for tag entry with fuzzy search and gallery navigation
 """
 
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -13,9 +13,39 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QEvent, pyqtSignal
+from PyQt5.QtCore import Qt, QEvent, QRunnable, QThreadPool, QTimer, pyqtSignal
 
-from .utils import fuzzy_search
+from .utils import fuzzy_search, FuzzySearchIndex
+
+# Wait this long after the last keystroke before searching suggestions
+SUGGESTION_DEBOUNCE_MS = 100
+
+# Maximum number of suggestions to show
+MAX_SUGGESTIONS = 20
+
+
+class _SuggestionSearch(QRunnable):
+    """Runs one suggestion search on the thread pool and reports back by signal"""
+
+    def __init__(self, owner, generation, query, index):
+        super().__init__()
+        self.owner = owner
+        self.generation = generation
+        self.query = query
+        self.index = index
+
+    def run(self):
+        # Superseded by a newer search before it got a thread
+        if self.generation != self.owner._gen:
+            return
+
+        # A top-N search lets fuzzy_search stop at prefix hits when there are
+        # enough of them, skipping the edit distance scan
+        matches = fuzzy_search(self.query, self.index, max_results=MAX_SUGGESTIONS)
+        try:
+            self.owner._resultsReady.emit(self.generation, matches)
+        except RuntimeError:
+            pass  # Widget was deleted while searching
 
 
 class NavigationLineEdit(QLineEdit):
@@ -69,13 +99,31 @@ class TagEntryWidget(QWidget):
     """
 
     tag_added = pyqtSignal(str, str)
+    _resultsReady = pyqtSignal(int, list)  # (generation, matches) from worker
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.all_tags: List[str] = []
+        # Search indexes over all_tags, normalized once per set_tags
+        self._search_index = FuzzySearchIndex([])
+        self._category_search_index: Optional[FuzzySearchIndex] = None
+        self._value_search_indexes: Dict[str, FuzzySearchIndex] = {}
         self._active_entry_field: Optional[str] = None
         self._keep_category = True  # Default behavior: keep category after add
 
+        # Coalesce keystrokes into one suggestion search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SUGGESTION_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_suggestion_search)
+
+        # Searches run on the thread pool; results from older searches (or
+        # arriving after the list was hidden) are dropped
+        self._pool = QThreadPool.globalInstance()
+        self._gen = 0
+        self._search_running = False
+        self._resultsReady.connect(self._on_results_ready)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -126,7 +174,14 @@ class TagEntryWidget(QWidget):
 
     def set_tags(self, tags: List[str]):
         """Set the list of available tags for autocomplete"""
+        if tags == self.all_tags:
+            return
         self.all_tags = tags
+        # Normalize once here instead of on every keystroke; the category and
+        # per-category indexes are built when first searched
+        self._search_index = FuzzySearchIndex(self.all_tags)
+        self._category_search_index = None
+        self._value_search_indexes = {}
 
     def set_navigation_callback(self, callback: Callable[[int], None]):
         """Set the callback for gallery navigation (Up/Down)"""
@@ -137,7 +192,7 @@ class TagEntryWidget(QWidget):
         """Clear both input fields"""
         self.category_entry.clear()
         self.tag_entry.clear()
-        self.suggestion_list.setVisible(False)
+        self.hide_suggestions()
 
     def cleanup_after_add(self):
         """Clear inputs based on keep_category mode"""
@@ -145,9 +200,16 @@ class TagEntryWidget(QWidget):
         if not self._keep_category:
             self.category_entry.clear()
 
-        self.suggestion_list.setVisible(False)
+        self.hide_suggestions()
         self.tag_entry.setFocus()
 
+    def hide_suggestions(self):
+        """Hide the suggestion list, dropping any search still waiting to run"""
+        self._search_timer.stop()
+        self._gen += 1
+        self._search_running = False
+        self.suggestion_list.setVisible(False)
+
     def set_keep_category_mode(self, keep: bool):
         """If True, category field is NOT cleared after adding a tag"""
         self._keep_category = keep
@@ -161,43 +223,100 @@ class TagEntryWidget(QWidget):
     def _on_category_changed(self, text: str):
         self._active_entry_field = "category"
         if not text:
-            self.suggestion_list.setVisible(False)
+            self.hide_suggestions()
             return
-
-        # Extract unique categories
-        all_categories = list(
-            set(t.split(":", 1)[0] for t in self.all_tags if ":" in t)
-        )
-        self._update_suggestions(text, all_categories)
+        self._search_timer.start()
 
     def _on_tag_entry_changed(self, text: str):
         self._active_entry_field = "tag"
         if not text:
-            self.suggestion_list.setVisible(False)
+            self.hide_suggestions()
+            return
+        self._search_timer.start()
+
+    def _run_suggestion_search(self, wait: bool = False):
+        """Search suggestions for the field that was edited last
+
+        Args:
+            wait: Search on this thread and show the results before returning,
+                instead of on the thread pool
+        """
+        if self._active_entry_field == "category":
+            text = self.category_entry.text()
+            if not text:
+                return
+
+            if self._category_search_index is None:
+                # Extract unique categories
+                all_categories = list(
+                    set(t.split(":", 1)[0] for t in self.all_tags if ":" in t)
+                )
+                self._category_search_index = FuzzySearchIndex(all_categories)
+            self._update_suggestions(text, self._category_search_index, wait)
+            return
+
+        text = self.tag_entry.text()
+        if not text:
             return
 
         category = self.category_entry.text().strip()
         if category:
             # Suggest tags for this category
-            candidates = [
-                t.split(":", 1)[1]
-                for t in self.all_tags
-                if t.startswith(f"{category}:")
-            ]
+            candidates = self._value_search_indexes.get(category)
+            if candidates is None:
+                candidates = FuzzySearchIndex(
+                    [
+                        t.split(":", 1)[1]
+                        for t in self.all_tags
+                        if t.startswith(f"{category}:")
+                    ]
+                )
+                self._value_search_indexes[category] = candidates
         else:
             # Suggest full tags
-            candidates = self.all_tags
+            candidates = self._search_index
+
+        self._update_suggestions(text, candidates, wait)
+
+    def _update_suggestions(
+        self, text: str, candidates: FuzzySearchIndex, wait: bool = False
+    ):
+        self._gen += 1
+        search = _SuggestionSearch(self, self._gen, text.strip(), candidates)
+        if wait:
+            # Direct connection: the results are shown before run() returns
+            search.run()
+        else:
+            self._search_running = True
+            self._pool.start(search)
 
-        self._update_suggestions(text, candidates)
+    def _on_results_ready(self, generation: int, matches: list):
+        """Show search results unless a newer search started or the list was hidden"""
+        if generation != self._gen:
+            return
+        self._search_running = False
 
-    def _update_suggestions(self, text: str, candidates: List[str]):
-        matches = fuzzy_search(text.strip(), candidates)
         if matches:
-            self.suggestion_list.clear()
-            for match_text, _ in matches:
-                self.suggestion_list.addItem(match_text)
-            if self.suggestion_list.count() > 0:
-                self.suggestion_list.setCurrentRow(0)
+            texts = [match_text for match_text, _ in matches]
+            suggestion_list = self.suggestion_list
+
+            # Keep the leading items that did not change and replace only the
+            # tail, painting the list once
+            keep = 0
+            limit = min(len(texts), suggestion_list.count())
+            while keep < limit and suggestion_list.item(keep).text() == texts[keep]:
+                keep += 1
+
+            suggestion_list.setUpdatesEnabled(False)
+            suggestion_list.blockSignals(True)
+            try:
+                for row in range(suggestion_list.count() - 1, keep - 1, -1):
+                    suggestion_list.takeItem(row)
+                suggestion_list.addItems(texts[keep:])
+                suggestion_list.setCurrentRow(0)
+            finally:
+                suggestion_list.blockSignals(False)
+                suggestion_list.setUpdatesEnabled(True)
             self.suggestion_list.setVisible(True)
         else:
             self.suggestion_list.setVisible(False)
@@ -217,7 +336,7 @@ class TagEntryWidget(QWidget):
             self.tag_entry.setText(suggestion)
             self.tag_entry.setFocus()
 
-        self.suggestion_list.setVisible(False)
+        self.hide_suggestions()
 
     def _on_add_clicked(self):
         category = self.category_entry.text().strip()
@@ -238,6 +357,16 @@ class TagEntryWidget(QWidget):
         if (
             obj == self.tag_entry or obj == self.category_entry
         ) and event.type() == QEvent.KeyPress:
+            searching = self._search_timer.isActive() or self._search_running
+            if searching and event.key() in (
+                Qt.Key_Down,
+                Qt.Key_Up,
+                Qt.Key_Tab,
+                Qt.Key_Escape,
+            ):
+                # Act on suggestions for what was typed, not the last search
+                self._search_timer.stop()
+                self._run_suggestion_search(wait=True)
             if self.suggestion_list.isVisible() and self.suggestion_list.count() > 0:
                 key = event.key()
                 if key == Qt.Key_Down:
@@ -2,10 +2,50 @@
 TagFilterInput - Reusable tag filter input widget with fuzzy search
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListWidget
-from PyQt5.QtCore import Qt, QEvent, pyqtSignal
+import sys
 
-from .utils import fuzzy_search
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListView
+from PyQt5.QtCore import (
+    Qt,
+    QEvent,
+    QModelIndex,
+    QRunnable,
+    QStringListModel,
+    QThreadPool,
+    pyqtSignal,
+)
+
+from .utils import fuzzy_search, FuzzySearchIndex
+
+# Maximum number of suggestions shown in the inline list
+MAX_SUGGESTIONS = 20
+
+# Filter parser operators (never suggested against)
+_OPS = frozenset({"AND", "OR", "NOT"})
+
+
+class _SuggestionSearch(QRunnable):
+    """Runs one suggestion search on the thread pool and reports back by signal"""
+
+    def __init__(self, owner, generation, query, index):
+        super().__init__()
+        self.owner = owner
+        self.generation = generation
+        self.query = query
+        self.index = index
+
+    def run(self):
+        # Superseded by a newer keystroke before it got a thread
+        if self.generation != self.owner._gen:
+            return
+
+        matches = fuzzy_search(self.query, self.index, max_results=MAX_SUGGESTIONS)[
+            :MAX_SUGGESTIONS
+        ]
+        try:
+            self.owner._resultsReady.emit(self.generation, matches)
+        except RuntimeError:
+            pass  # Widget was deleted while searching
 
 
 class TagFilterInput(QWidget):
@@ -25,10 +65,16 @@ class TagFilterInput(QWidget):
 
     filterTextChanged = pyqtSignal(str)  # Emitted on text change
     filterApplied = pyqtSignal(str)  # Emitted when Enter pressed
+    _resultsReady = pyqtSignal(int, list)  # (generation, matches) from worker
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.all_tags = []
+        self._search_index = FuzzySearchIndex([])
+        self._last_tail = None  # Tail word the suggestions were last built for
+        self._pool = QThreadPool.globalInstance()
+        self._gen = 0  # Bumped per search; results from older searches are dropped
+        self._resultsReady.connect(self._on_results_ready)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -45,13 +91,18 @@ class TagFilterInput(QWidget):
         self.filter_input.installEventFilter(self)
         layout.addWidget(self.filter_input)
 
-        # Inline suggestion list
-        self.suggestion_list = QListWidget()
+        # Inline suggestion list (persistent model, reset once per update)
+        self.suggestion_list = QListView()
+        self._model = QStringListModel(self.suggestion_list)
+        self._suggestions = []  # Python copy of the model's current rows
+        self.suggestion_list.setModel(self._model)
+        self.suggestion_list.setEditTriggers(QListView.NoEditTriggers)
+        self.suggestion_list.setUniformItemSizes(True)  # Single-line text rows
         self.suggestion_list.setMaximumHeight(150)
         self.suggestion_list.setVisible(False)
-        self.suggestion_list.itemClicked.connect(self._accept_suggestion)
+        self.suggestion_list.clicked.connect(self._accept_suggestion)
         self.suggestion_list.setStyleSheet(
-            "QListWidget { border: 1px solid palette(mid); }"
+            "QListView { border: 1px solid palette(mid); }"
         )
         layout.addWidget(self.suggestion_list)
 
@@ -61,7 +112,11 @@ class TagFilterInput(QWidget):
         Args:
             tags: List of tag strings (e.g., ["class:lake", "setting:mountain"])
         """
-        self.all_tags = tags
+        # Interned so repeated tag lists share one copy of each string
+        self.all_tags = [sys.intern(t) for t in tags]
+        # Normalize once here instead of on every keystroke
+        self._search_index = FuzzySearchIndex(self.all_tags)
+        self._last_tail = None
 
     def get_filter_text(self):
         """Get current filter text
@@ -74,16 +129,28 @@ class TagFilterInput(QWidget):
     def set_filter_text(self, text):
         """Set filter text
 
+        Programmatic restores (e.g. loading a saved filter) don't run a
+        suggestion search; filterTextChanged is still emitted.
+
         Args:
             text: Filter expression to set
         """
+        self.filter_input.blockSignals(True)
         self.filter_input.setText(text)
+        self.filter_input.blockSignals(False)
+
+        # Drop suggestions (and any search in flight) for the previous text
+        self._gen += 1
+        self._last_tail = None
+        self._hide_suggestions()
+
+        self.filterTextChanged.emit(text)
 
     def clear_filter(self):
         """Clear filter text and hide suggestions"""
         self.filter_input.clear()
-        self.suggestion_list.clear()
-        self.suggestion_list.setVisible(False)
+        self._hide_suggestions()
+        self._last_tail = None
 
     def _on_text_changed(self, text):
         """Handle filter text change - update fuzzy search suggestions"""
@@ -95,111 +162,136 @@ class TagFilterInput(QWidget):
 
     def _update_suggestions(self, text):
         """Update inline suggestion list with fuzzy search results"""
-        # Get the last word being typed
-        words = text.split()
-        if not words:
-            self.suggestion_list.clear()
-            self.suggestion_list.setVisible(False)
+        # Nothing to show while the panel is hidden (e.g. another tab is active)
+        if not self.isVisible():
             return
 
-        last_word = words[-1]
+        # Get the last word being typed (only the tail, no full token list)
+        last_word = text[text.rfind(" ") + 1 :]
+
+        # Edits before the last word don't change the suggestions
+        if last_word == self._last_tail:
+            return
+        self._last_tail = last_word
+        self._gen += 1
 
-        # Skip logical operators
-        if last_word.upper() in ["AND", "OR", "NOT"] or len(last_word) == 0:
-            self.suggestion_list.clear()
-            self.suggestion_list.setVisible(False)
+        # Skip empty words and logical operators (all operators are <= 3 chars)
+        if not last_word or (len(last_word) <= 3 and last_word.upper() in _OPS):
+            self._hide_suggestions()
             return
 
-        # Perform fuzzy search on tags
+        # Perform fuzzy search on tags (off the UI thread)
         if self.all_tags:
-            matches = fuzzy_search(last_word, self.all_tags)
-
-            if matches:
-                # Show all matches in suggestion list
-                self.suggestion_list.clear()
-                for match_text, score in matches:
-                    self.suggestion_list.addItem(match_text)
-
-                # DO NOT auto-select first item - user must press Down to enter list
-                self.suggestion_list.setCurrentRow(-1)
-                self.suggestion_list.setVisible(True)
-            else:
-                self.suggestion_list.clear()
-                self.suggestion_list.setVisible(False)
+            self._pool.start(
+                _SuggestionSearch(self, self._gen, last_word, self._search_index)
+            )
         else:
             # Show helpful message when no tags available
-            self.suggestion_list.clear()
-            self.suggestion_list.addItem("(No tags available)")
-            self.suggestion_list.setVisible(True)
+            self._show_suggestions(["(No tags available)"])
+
+    def _on_results_ready(self, generation, matches):
+        """Show search results from the worker unless a newer search started"""
+        if generation != self._gen:
+            return
+
+        if matches:
+            self._show_suggestions([m for m, _ in matches])
+        else:
+            self._hide_suggestions()
+
+    def _show_suggestions(self, suggestions):
+        """Show suggestions, resetting the model only if they changed"""
+        if suggestions != self._suggestions:
+            # Single model reset, painted once after the swap
+            self.suggestion_list.setUpdatesEnabled(False)
+            self._model.setStringList(suggestions)
+            self.suggestion_list.setUpdatesEnabled(True)
+            self.suggestion_list.viewport().update()
+            self._suggestions = suggestions
+
+        # DO NOT auto-select first item - user must press Down to enter list
+        self._set_current_row(-1)
+        self.suggestion_list.setVisible(True)
+
+    def _hide_suggestions(self):
+        """Hide suggestions, keeping the rows for reuse by the next update"""
+        self._set_current_row(-1)
+        self.suggestion_list.setVisible(False)
+
+    def _current_row(self):
+        """Row of the current suggestion, or -1 if none is selected"""
+        return self.suggestion_list.selectionModel().currentIndex().row()
+
+    def _set_current_row(self, row):
+        """Select the suggestion at row (-1 clears the selection)"""
+        index = self._model.index(row, 0) if row >= 0 else QModelIndex()
+        self.suggestion_list.setCurrentIndex(index)
 
     def _on_return_pressed(self):
         """Handle Return key when not in suggestion list"""
         # Only emit if no suggestion is selected
-        if self.suggestion_list.currentRow() == -1:
+        if self._current_row() == -1:
             self.filterApplied.emit(self.get_filter_text())
 
     def eventFilter(self, obj, event):
         """Handle keyboard events for inline suggestion navigation"""
         if obj == self.filter_input and event.type() == QEvent.KeyPress:
-            if self.suggestion_list.isVisible() and self.suggestion_list.count() > 0:
+            count = self._model.rowCount()
+            if self.suggestion_list.isVisible() and count > 0:
                 key = event.key()
 
                 if key == Qt.Key_Down:
                     # Move selection down in suggestion list, or enter list if no selection
-                    current_row = self.suggestion_list.currentRow()
+                    current_row = self._current_row()
                     if current_row == -1:
                         # Enter the list by selecting first item
-                        self.suggestion_list.setCurrentRow(0)
-                    elif current_row < self.suggestion_list.count() - 1:
-                        self.suggestion_list.setCurrentRow(current_row + 1)
+                        self._set_current_row(0)
+                    elif current_row < count - 1:
+                        self._set_current_row(current_row + 1)
                     return True
 
                 elif key == Qt.Key_Up:
                     # Move selection up in suggestion list
-                    current_row = self.suggestion_list.currentRow()
+                    current_row = self._current_row()
                     if current_row > 0:
-                        self.suggestion_list.setCurrentRow(current_row - 1)
+                        self._set_current_row(current_row - 1)
                     elif current_row == 0:
                         # Exit the list by clearing selection
-                        self.suggestion_list.setCurrentRow(-1)
+                        self._set_current_row(-1)
                     return True
 
                 elif key == Qt.Key_Return:
                     # Enter key with selected item - accept suggestion
-                    current_row = self.suggestion_list.currentRow()
-                    if current_row >= 0:
-                        current_item = self.suggestion_list.currentItem()
-                        if current_item:
-                            self._accept_suggestion(current_item)
-                            return True
+                    current_index = self.suggestion_list.selectionModel().currentIndex()
+                    if current_index.isValid():
+                        self._accept_suggestion(current_index)
+                        return True
                     # No selection - let returnPressed signal handle it
                     return False
 
                 elif key == Qt.Key_Tab:
                     # Tab always accepts suggestion if one is selected
-                    current_row = self.suggestion_list.currentRow()
-                    if current_row >= 0:
-                        current_item = self.suggestion_list.currentItem()
-                        if current_item:
-                            self._accept_suggestion(current_item)
-                            return True
+                    current_index = self.suggestion_list.selectionModel().currentIndex()
+                    if current_index.isValid():
+                        self._accept_suggestion(current_index)
+                        return True
 
                 elif key == Qt.Key_Escape:
                     # Hide suggestions
-                    self.suggestion_list.setVisible(False)
+                    self._hide_suggestions()
                     return True
 
         return super().eventFilter(obj, event)
 
-    def _accept_suggestion(self, item):
+    def _accept_suggestion(self, index):
         """Accept the selected suggestion and insert into filter input
 
         Always wraps the tag in quotes to handle spaces correctly.
         """
-        if not item:
+        if not index.isValid():
             return
 
-        suggestion = item.text()
+        suggestion = index.data()
 
         # Skip if it's the placeholder message
         if suggestion.startswith("(No tags"):
@@ -207,24 +299,20 @@ class TagFilterInput(QWidget):
 
         # Get current text
         current_text = self.filter_input.text()
-        words = current_text.split()
 
         # Wrap suggestion in quotes (always, per user requirement)
         quoted_suggestion = f'"{suggestion}"'
 
         # Replace the last word with the quoted suggestion
-        if words:
-            words[-1] = quoted_suggestion
-            new_text = " ".join(words) + " "  # Add space after for next word
-        else:
-            new_text = quoted_suggestion + " "
+        head, sep, _ = current_text.rpartition(" ")
+        new_text = f"{head}{sep}{quoted_suggestion} "  # Add space after for next word
 
         self.filter_input.setText(new_text)
         self.filter_input.setFocus()
 
         # Hide suggestions after acceptance
-        self.suggestion_list.clear()
-        self.suggestion_list.setVisible(False)
+        self._hide_suggestions()
+        self._last_tail = None
 
     def focusInEvent(self, event):
         """Focus input field when widget receives focus"""
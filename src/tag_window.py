@@ -10,8 +10,7 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QListWidget,
     QListWidgetItem,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QGroupBox,
     QCheckBox,
@@ -30,30 +29,306 @@ from PyQt5.QtWidgets import (
     QMenu,
     QAction,
 )
-from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtCore import (
+    Qt,
+    QEvent,
+    QAbstractTableModel,
+    QModelIndex,
+    QRunnable,
+    QSortFilterProxyModel,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 
 
-from typing import List
+from collections import Counter
+from typing import List, Optional, Set
+import weakref
 
 from .tag_entry_widget import TagEntryWidget
-from .utils import fuzzy_search
+from .utils import fuzzy_search, FuzzySearchIndex
+from .app_manager import AppManager
 from .data_models import ImageData, Tag
 from .saved_filters_dialog import SavedFiltersDialog
-from .filter_parser import evaluate_filter
+from .gallery import Gallery
+from .filter_parser import (
+    compile_filter,
+    constant_result,
+    literal_alternatives,
+    parse_filter,
+)
+
+
+# Delay before search/quick add text changes are applied, coalescing keystrokes
+SEARCH_DEBOUNCE_MS = 120
+
+# Extra width added to fitted tag table columns for cell margins
+COLUMN_PADDING = 8
+
+
+def _format_count(count: int, total_count: int) -> str:
+    """Count column text for a tag seen count times, total_count with duplicates"""
+    if total_count > count:
+        num_dups = total_count - count
+        dup_word = "duplicate" if num_dups == 1 else "duplicates"
+        return f"{total_count}, {num_dups} {dup_word}"
+    return str(count)
+
+
+def _project_tag_rows(tag_index) -> list:
+    """Build table rows for all tags in the project with counts
+
+    Args:
+        tag_index: AppManager.get_project_tag_index() result, tag_str ->
+            [representative tag, occurrences, total count]
+
+    Returns:
+        Rows of [category, tag value, count text, tag object] sorted by tag
+    """
+    rows = []
+    for tag_str, (tag, count, total_count) in sorted(tag_index.items()):
+        count_text = _format_count(count, total_count)
+        rows.append([tag.category, tag.value, count_text, tag])
+    return rows
+
+
+class _ProjectTagsLoader(QRunnable):
+    """Counts the tags of images missing from the project tag index on the
+    thread pool and reports back by signal"""
+
+    def __init__(self, owner, generation, image_paths, loaded_tags, image_list):
+        super().__init__()
+        self.owner = owner
+        self.generation = generation
+        self.image_paths = image_paths
+        self.loaded_tags = loaded_tags
+        self.image_list = image_list
+
+    def run(self):
+        # Superseded by a newer load before it got a thread
+        if self.generation != self.owner._project_tags_gen:
+            return
+
+        counted = {}
+        for img_path in self.image_paths:
+            tags = self.loaded_tags.get(img_path)
+            if tags is None:
+                tags = self.image_list.get_image_data(img_path).tags
+            counted[img_path] = AppManager.count_image_tags(tags)
+        try:
+            self.owner._projectTagsReady.emit(
+                self.generation, self.image_list, counted
+            )
+        except RuntimeError:
+            pass  # Window was deleted while loading
+
+
+class TagTableModel(QAbstractTableModel):
+    """Table model backing the tags table
+
+    Each row is a list of [category, tag value, count text, tag object]. The
+    tag object is exposed through Qt.UserRole on the Category and Tag columns.
+    """
+
+    HEADERS = ["Category", "Tag", "Count"]
+
+    # Emitted with (row, column) after the user edits a Category or Tag cell
+    tagEdited = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_texts = None  # Built by row_texts, dropped when texts change
+
+    def set_rows(self, rows: list):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self._row_texts = None
+        self.endResetModel()
+
+    def find_row(self, category: str, value: str) -> int:
+        """Row showing category:value, or -1"""
+        for row, (row_category, row_value, _, _) in enumerate(self._rows):
+            if row_category == category and row_value == value:
+                return row
+        return -1
+
+    def insert_row(self, row: int, values: list):
+        """Insert a single row"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, values)
+        self._row_texts = None
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        """Remove a single row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._row_texts = None
+        self.endRemoveRows()
+
+    def revert_row(self, row: int):
+        """Show the row's tag again in its Category and Tag cells"""
+        tag = self._rows[row][3]
+        self._rows[row][0] = tag.category
+        self._rows[row][1] = tag.value
+        self._row_texts = None
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 1), [Qt.DisplayRole])
+
+    def set_count_text(self, row: int, count_text: str):
+        """Update the Count cell of a row"""
+        self._rows[row][2] = count_text
+        index = self.index(row, 2)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def column_texts(self, column: int) -> Set[str]:
+        """Distinct display texts in a column"""
+        return {row[column] for row in self._rows}
+
+    def row_texts(self) -> list:
+        """(category, tag value, "category:value") of every row
+
+        The same list is returned until a Category or Tag text changes.
+        """
+        if self._row_texts is None:
+            self._row_texts = [
+                (category, value, f"{category}:{value}")
+                for category, value, _, _ in self._rows
+            ]
+        return self._row_texts
+
+    def tag_at(self, row: int) -> Optional[Tag]:
+        """Tag object shown in row"""
+        return self._rows[row][3]
+
+    def text_at(self, row: int, column: int) -> str:
+        """Display text of a cell"""
+        return self._rows[row][column]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return row[index.column()]
+        if role == Qt.ToolTipRole and index.column() < 2:
+            return row[index.column()]
+        if role == Qt.UserRole and index.column() < 2:
+            return row[3]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        # Only Category and Tag are editable, Count is read-only
+        if role != Qt.EditRole or not index.isValid() or index.column() >= 2:
+            return False
+        row = self._rows[index.row()]
+        if row[index.column()] == value:
+            return True
+        row[index.column()] = value
+        self._row_texts = None
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.tagEdited.emit(index.row(), index.column())
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() < 2:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+
+class TagFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the source rows in a precomputed set (None shows all rows)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._visible_rows: Optional[Set[int]] = None
+        # False once source rows shift, since the set then no longer matches
+        self._filter_current = True
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.rowsInserted.connect(self._mark_filter_stale)
+        model.rowsRemoved.connect(self._mark_filter_stale)
+
+    def _mark_filter_stale(self, *args):
+        self._filter_current = False
+
+    def set_visible_rows(self, rows: Optional[Set[int]]):
+        """Set the source rows to show and refilter once (skipped if unchanged)"""
+        if self._filter_current and rows == self._visible_rows:
+            return
+        self._visible_rows = rows
+        self._filter_current = True
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._visible_rows is None or source_row in self._visible_rows
 
 
 class TagWindow(QWidget):
     """Tag editor window for viewing and modifying tags"""
 
+    # (generation, image list, counted tags) from the project tags worker
+    _projectTagsReady = pyqtSignal(int, object, dict)
+
     def __init__(self, app_manager, parent=None):
         super().__init__(parent)
         self.app_manager = app_manager
         self.all_tags = []
+        self._tag_list_version = None  # (TagList, version) all_tags was read at
+        self._tags_stale = True  # Table needs _load_tags on next show
+        self._category_index = {}  # category -> full tags in that category
         self._updating = False
         self.quick_add_tags = []  # Parsed list of tags for quick add
         self._multi_select_warned = False  # Track if we've shown multi-select warning
         self._active_filter = ""  # Track active filter expression for tags table
-        self._stored_selection = set()  # Store selection for multi-edit operations
+        self._compiled_filter = None  # Predicate for _active_filter (None if invalid)
+        self._filter_constant = None  # Result of _active_filter if tag-independent
+        self._filter_eval_cache = {}  # (active_filter, full_tag) -> bool
+        # (row texts, filter, rows passing it, text -> rows) for the tag search,
+        # with a search index over those texts built on first search
+        self._table_search_cache = None
+        self._table_search_index = None
+        self._stored_selection = ()  # Store selection for multi-edit operations
+        self._editing_old_tag = None  # Tag being edited via _edit_tag, if any
+        self._editing_row = None  # Model row of that edit
+        self._gallery_ref = None  # weakref to the Gallery found by _find_gallery
+        self._image_tag_counts = {}  # img_path -> Counter(tag_str) for loaded images
+        self._tags_updated_in_place = False  # Skip reload on our deferred project_changed
+        self._project_tags_gen = 0  # Bumped per load; older project tag results dropped
+        self._projectTagsReady.connect(self._apply_project_tags)
+
+        # Timers for debouncing search and quick add typing
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._update_visible_tags)
+        self._quick_add_timer = QTimer(self)
+        self._quick_add_timer.setSingleShot(True)
+        self._quick_add_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._quick_add_timer.timeout.connect(self._parse_quick_add_tags)
+
+        # Coalesces the project-wide refresh after a run of tag edits
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self._active_entry_field = (
             None  # Track which entry field is currently active (category or tag)
         )
@@ -80,8 +355,7 @@ class TagWindow(QWidget):
         self._setup_ui()
 
         # Connect to signals
-        self.app_manager.project_changed.connect(self._load_tags)
-        self.app_manager.project_changed.connect(self._update_tag_suggestions)
+        self.app_manager.project_changed.connect(self._on_project_changed)
         self.app_manager.project_changed.connect(self._update_window_title)
         self.app_manager.project_changed.connect(self._load_default_filter)
         self.app_manager.library_changed.connect(self._load_tags)
@@ -147,7 +421,7 @@ class TagWindow(QWidget):
         self.quick_add_input.setPlaceholderText(
             "category1, category2:tag1, category3:tag2"
         )
-        self.quick_add_input.textChanged.connect(self._parse_quick_add_tags)
+        self.quick_add_input.textChanged.connect(self._quick_add_timer.start)
         quick_input_layout.addWidget(self.quick_add_input)
         contents_layout.addLayout(quick_input_layout)
 
@@ -195,34 +469,37 @@ class TagWindow(QWidget):
 
         layout.addLayout(search_layout)
 
-        self.tags_table = QTableWidget()
-        self.tags_table.setColumnCount(3)
-        self.tags_table.setHorizontalHeaderLabels(["Category", "Tag", "Count"])
+        # Tags live in a model; the proxy hides rows rejected by filter/search
+        self.tag_model = TagTableModel(self)
+        self.tag_proxy = TagFilterProxyModel(self)
+        self.tag_proxy.setSourceModel(self.tag_model)
+        self.tag_model.tagEdited.connect(self._on_tag_edited_dispatch)
 
-        # Enable text wrapping for long tags/captions
-        self.tags_table.setWordWrap(True)
-        self.tags_table.verticalHeader().setSectionResizeMode(
-            QHeaderView.ResizeToContents
-        )
+        self.tags_table = QTableView()
+        self.tags_table.setModel(self.tag_proxy)
+
+        # One fixed row height: sizing rows to their wrapped text measured every
+        # row on each load. Long tags are elided and shown in full as tooltips
+        self.tags_table.setWordWrap(False)
+        self.tags_table.setTextElideMode(Qt.ElideRight)
+        self.tags_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Enable multi-row selection for bulk editing
-        self.tags_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.tags_table.setSelectionMode(QTableWidget.ExtendedSelection)
+        self.tags_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tags_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
         # Make Category and Tag columns editable, Count column read-only
         # Resize columns appropriately
         header = self.tags_table.horizontalHeader()
         header.setStretchLastSection(False)
-        header.setSectionResizeMode(
-            0, QHeaderView.ResizeToContents
-        )  # Category column fits content
+        # Category and Count columns are fitted once per load by
+        # _fit_column_widths rather than measuring every cell on each change
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Tag column stretches
-        header.setSectionResizeMode(
-            2, QHeaderView.ResizeToContents
-        )  # Count column fits content
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
 
         # Connect signals
-        self.tags_table.itemDoubleClicked.connect(self._edit_tag)
+        self.tags_table.doubleClicked.connect(self._edit_tag)
         self.tags_table.installEventFilter(self)  # Install event filter for Del key
 
         # Enable custom context menu for right-click
@@ -242,10 +519,38 @@ class TagWindow(QWidget):
         instructions.setStyleSheet("color: gray; font-size: 10px;")
         layout.addWidget(instructions)
 
+    def _on_project_changed(self):
+        """Reload tags and suggestions unless the change was already applied in place"""
+        updated_in_place = self._tags_updated_in_place
+        self._tags_updated_in_place = False
+        if updated_in_place and self.app_manager.project_change_deferred:
+            return
+        self._load_tags()
+        self._update_tag_suggestions()
+
     def _update_tag_suggestions(self):
         """Update autocomplete suggestions with all tags in project"""
+        if not self.isVisible():
+            # showEvent catches up
+            return
+
+        # Nothing to do if the tag list has not changed since the last update
+        tag_list = self.app_manager.get_tag_list()
+        if (tag_list, tag_list.version) == self._tag_list_version:
+            return
+        self._tag_list_version = (tag_list, tag_list.version)
+
         # Get only full tags (not categories) for suggestions
-        self.all_tags = self.app_manager.get_tag_list().get_all_full_tags()
+        all_tags = tag_list.get_all_full_tags()
+        if all_tags == self.all_tags:
+            return
+        self.all_tags = all_tags
+
+        # Index full tags by category for quick add category expansion
+        self._category_index = {}
+        for tag_str in self.all_tags:
+            category = tag_str.split(":", 1)[0]
+            self._category_index.setdefault(category, []).append(tag_str)
 
         # Update widget
         self.tag_entry_widget.set_tags(self.all_tags)
@@ -285,18 +590,30 @@ class TagWindow(QWidget):
 
         if default_filter:
             # Store filter and apply it silently to tags table
-            self._active_filter = default_filter
+            self._set_active_filter(default_filter)
             self._update_visible_tags()
             self._update_filter_button_appearance()
         else:
             # No default filter
-            self._active_filter = ""
+            self._set_active_filter("")
             self._update_filter_button_appearance()
 
+    def _set_active_filter(self, filter_expression: str):
+        """Set the tags table filter, parsing it once and resetting cached results"""
+        self._active_filter = filter_expression
+        self._filter_eval_cache.clear()
+        try:
+            self._compiled_filter = compile_filter(filter_expression)
+        except ValueError:
+            # Invalid filter - hides every tag
+            self._compiled_filter = None
+            self._filter_constant = False
+        else:
+            # e.g. "*" keeps every tag, so rows need not be evaluated
+            self._filter_constant = constant_result(parse_filter(filter_expression))
+
     def _open_filter_dialog(self):
         """Open filter dialog for tags"""
-        from .saved_filters_dialog import SavedFiltersDialog
-
         # Open dialog in "tags" mode and pass current active filter
         dialog = SavedFiltersDialog(
             self.app_manager,
@@ -310,7 +627,7 @@ class TagWindow(QWidget):
             filter_expression = dialog.get_filter_expression()
 
             # Apply filter to tags table
-            self._active_filter = filter_expression
+            self._set_active_filter(filter_expression)
             self._update_visible_tags()
             self._update_filter_button_appearance()
 
@@ -328,8 +645,8 @@ class TagWindow(QWidget):
             self.filter_btn.setText("Filter")
 
     def _on_search_changed(self, text: str):
-        """Handle search text change - update visible tags"""
-        self._update_visible_tags()
+        """Handle search text change - update visible tags once typing pauses"""
+        self._search_timer.start()
 
     def _on_quick_add_toggled(self, checked: bool):
         """Handle quick add section toggle"""
@@ -353,7 +670,6 @@ class TagWindow(QWidget):
 
         # Expand categories and collect all tags
         expanded_tags = []
-        tag_list = self.app_manager.get_tag_list()
 
         for entry in entries:
             if ":" in entry:
@@ -363,10 +679,7 @@ class TagWindow(QWidget):
                 # Category - expand to all tags in that category
                 category = entry
                 # Get all tags with this category
-                all_full_tags = tag_list.get_all_full_tags()
-                category_tags = [
-                    tag for tag in all_full_tags if tag.startswith(f"{category}:")
-                ]
+                category_tags = self._category_index.get(category, [])
                 if category_tags:
                     expanded_tags.extend(category_tags)
                 else:
@@ -388,14 +701,21 @@ class TagWindow(QWidget):
     def _populate_quick_add_list(self):
         """Populate the quick add list with checkboxes"""
         self._updating = True
+        # Rebuild without per-item itemChanged emissions or repaints
+        self.quick_add_list.setUpdatesEnabled(False)
+        self.quick_add_list.blockSignals(True)
         self.quick_add_list.clear()
 
         for tag_str in self.quick_add_tags:
             item = QListWidgetItem(tag_str)
+            item.setData(Qt.UserRole, tag_str)
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(Qt.Unchecked)
             self.quick_add_list.addItem(item)
 
+        self.quick_add_list.blockSignals(False)
+        self.quick_add_list.setUpdatesEnabled(True)
+
         # Update checkbox states based on active image
         self._update_quick_add_checkboxes()
         self._updating = False
@@ -415,18 +735,21 @@ class TagWindow(QWidget):
 
         # Get tags from active image
         img_data = self.app_manager.load_image_data(active_image)
-        image_tag_strs = set(str(tag) for tag in img_data.tags)
+        image_tag_strs = img_data.tag_str_set
 
-        # Update checkboxes
+        # Update checkboxes, only touching items whose state changes
         self._updating = True
+        self.quick_add_list.setUpdatesEnabled(False)
+        self.quick_add_list.blockSignals(True)
         for i in range(self.quick_add_list.count()):
             item = self.quick_add_list.item(i)
-            tag_str = item.text()
+            tag_str = item.data(Qt.UserRole)
 
-            if tag_str in image_tag_strs:
-                item.setCheckState(Qt.Checked)
-            else:
-                item.setCheckState(Qt.Unchecked)
+            state = Qt.Checked if tag_str in image_tag_strs else Qt.Unchecked
+            if item.checkState() != state:
+                item.setCheckState(state)
+        self.quick_add_list.blockSignals(False)
+        self.quick_add_list.setUpdatesEnabled(True)
         self._updating = False
 
     def _on_quick_add_item_changed(self, item: QListWidgetItem):
@@ -467,31 +790,40 @@ class TagWindow(QWidget):
                 return
 
         # Add or remove tag from all working images
-        for img_path in working_images:
-            img_data = self.app_manager.load_image_data(img_path)
-
+        changed_images = []
+        image_data_cache = self.app_manager.load_image_data_batch(working_images)
+        for img_path, img_data in image_data_cache.items():
             # Check if tag already exists
-            existing_tag = None
-            for tag in img_data.tags:
-                if str(tag) == tag_str:
-                    existing_tag = tag
-                    break
+            existing_tag = img_data.find_tag(tag_str)
 
             if is_checked:
                 # Add tag if it doesn't exist
                 if not existing_tag:
                     img_data.add_tag(category, value)
-                    self.app_manager.save_image_data(img_path, img_data)
+                    changed_images.append(img_path)
             else:
                 # Remove tag if it exists
                 if existing_tag:
                     img_data.remove_tag(existing_tag)
-                    self.app_manager.save_image_data(img_path, img_data)
+                    changed_images.append(img_path)
+        self.app_manager.save_image_data_batch(
+            {img_path: image_data_cache[img_path] for img_path in changed_images}
+        )
 
         # Update the main tags table and suggestions
-        self._load_tags()
-        self._update_tag_suggestions()
-        self.app_manager.update_project(save=True)
+        if is_checked:
+            self._apply_tag_changes(
+                working_images, [(Tag(category, value), changed_images, 1)]
+            )
+            self.app_manager.apply_tag_changes(
+                [], [Tag(category, value)] * len(changed_images)
+            )
+        else:
+            # Removed tags match the unstripped item text
+            removed_tag = Tag(parts[0], parts[1])
+            self._apply_tag_changes(working_images, [(removed_tag, changed_images, -1)])
+            self.app_manager.apply_tag_changes([removed_tag] * len(changed_images), [])
+        self._refresh_after_mutation()
 
     def _show_multi_select_warning(self, count: int) -> bool:
         """Show warning that multiple images are selected
@@ -520,117 +852,146 @@ class TagWindow(QWidget):
         Stage 1: Apply active filter (if any) using filter parser
         Stage 2: Apply fuzzy search from search input on category and tag columns
         """
-        # Collect all tag data from table (category, tag, full_tag)
-        all_table_tags = []
-        for row in range(self.tags_table.rowCount()):
-            category_item = self.tags_table.item(row, 0)
-            tag_item = self.tags_table.item(row, 1)
-            if category_item and tag_item:
-                category = category_item.text()
-                tag_value = tag_item.text()
-                full_tag = f"{category}:{tag_value}"
-                all_table_tags.append((row, category, tag_value, full_tag))
+        search_text = self.tag_search_input.text().strip()
 
-        # Stage 1: Apply filter parser if active filter is set
-        if self._active_filter:
-            filtered_tags = []
-            for row, category, tag_value, full_tag in all_table_tags:
-                try:
-                    # Evaluate filter with single tag
-                    result = evaluate_filter(self._active_filter, [full_tag])
-                    if result:
-                        filtered_tags.append((row, category, tag_value, full_tag))
-                except ValueError:
-                    # Invalid filter - hide this tag
-                    pass
-        else:
-            # No filter active - include all tags
-            filtered_tags = all_table_tags
+        filter_passes_all = not self._active_filter or self._filter_constant is True
 
-        # Stage 2: Apply fuzzy search
-        search_text = self.tag_search_input.text().strip()
+        # Fast path: nothing to filter, show every row without scanning the model
+        if filter_passes_all and not search_text:
+            self.tag_proxy.set_visible_rows(None)
+            return
+
+        filtered_rows, text_rows = self._table_search_data()
 
+        # Stage 2: fuzzy search over the distinct category, tag and full tag
+        # texts of the filtered rows, mapped back to the rows showing them
         if search_text:
-            # Search in category, tag, and full tag
-            matching_rows = set()
+            if self._table_search_index is None:
+                self._table_search_index = FuzzySearchIndex(list(text_rows))
+            visible_rows = set()
+            for candidate, _ in fuzzy_search(search_text, self._table_search_index):
+                visible_rows.update(text_rows[candidate])
+        else:
+            # No search text - show all filtered tags
+            visible_rows = set(filtered_rows)
 
-            for row, category, tag_value, full_tag in filtered_tags:
-                # Search in category
-                if fuzzy_search(search_text, [category]):
-                    matching_rows.add(row)
-                    continue
+        # Update table visibility (one proxy refilter)
+        self.tag_proxy.set_visible_rows(visible_rows)
 
-                # Search in tag value
-                if fuzzy_search(search_text, [tag_value]):
-                    matching_rows.add(row)
-                    continue
+    def _table_search_data(self):
+        """Rows passing the active filter and the rows showing each of their texts
 
-                # Search in full tag
-                if fuzzy_search(search_text, [full_tag]):
-                    matching_rows.add(row)
-                    continue
+        Stage 1 of _update_visible_tags. Kept, along with the search index over
+        the texts, until the table texts or the active filter change, so
+        typing in the search box only runs the search itself.
 
-            # Create final visible set
-            visible_tags = [
-                (row, category, tag_value, full_tag)
-                for row, category, tag_value, full_tag in filtered_tags
-                if row in matching_rows
-            ]
+        Returns:
+            Tuple of (filtered rows, dict of text -> rows showing it)
+        """
+        row_texts = self.tag_model.row_texts()
+        cached = self._table_search_cache
+        if (
+            cached is not None
+            and cached[0] is row_texts
+            and cached[1] == self._active_filter
+        ):
+            return cached[2], cached[3]
+
+        if not self._active_filter or self._filter_constant is True:
+            # No filter active (or one that keeps every tag) - include all tags
+            filtered_rows = list(range(len(row_texts)))
+        elif self._filter_constant is None:
+            # Evaluate filter with single tag (memoized per filter)
+            filtered_rows = []
+            compiled_filter = self._compiled_filter
+            eval_cache = self._filter_eval_cache
+            active_filter = self._active_filter
+            for row, (_, _, full_tag) in enumerate(row_texts):
+                key = (active_filter, full_tag)
+                result = eval_cache.get(key)
+                if result is None:
+                    result = compiled_filter([full_tag])
+                    eval_cache[key] = result
+                if result:
+                    filtered_rows.append(row)
         else:
-            # No search text - show all filtered tags
-            visible_tags = filtered_tags
-
-        # Update table visibility
-        visible_rows = {row for row, _, _, _ in visible_tags}
-        for row in range(self.tags_table.rowCount()):
-            self.tags_table.setRowHidden(row, row not in visible_rows)
+            # Invalid or always-false filter - hide all tags
+            filtered_rows = []
+
+        text_rows = {}
+        for row in filtered_rows:
+            for text in row_texts[row]:
+                rows = text_rows.get(text)
+                if rows is None:
+                    text_rows[text] = [row]
+                elif rows[-1] != row:
+                    rows.append(row)
+
+        self._table_search_cache = (
+            row_texts,
+            self._active_filter,
+            filtered_rows,
+            text_rows,
+        )
+        self._table_search_index = None
+        return filtered_rows, text_rows
 
     def _load_tags(self):
         """Load tags from selected/active images"""
+        # Any project-wide load still running is now stale
+        self._project_tags_gen += 1
+
+        if not self.isVisible():
+            # Nothing to show; showEvent reloads once the window is shown
+            self._tags_stale = True
+            return
+        self._tags_stale = False
+
         self._updating = True
 
         current_view = self.app_manager.get_current_view()
         working_images = current_view.get_working_images() if current_view else []
 
-        self.tags_table.setRowCount(0)
-
         if not working_images:
             # No images selected - show project-wide tag counts
+            self._image_tag_counts = {}
             self.info_label.setText("No images selected - showing all project tags")
+            # Rows come from the project tag index, once the worker has counted
+            # any images missing from it
+            self._set_table_rows([])
             self._load_project_tags()
             self._updating = False
             return
 
+        # Load each image once (uncached files are read in parallel), along
+        # with each image's tag strings and per-tag duplicate counts
+        image_data_cache = self.app_manager.load_image_data_batch(working_images)
+        tag_str_cache = {}  # img_path -> [str(tag), ...]
+        dup_count_cache = {}  # img_path -> Counter(tag_str)
+        for img_path, img_data in image_data_cache.items():
+            tag_str_cache[img_path] = [f"{t.category}:{t.value}" for t in img_data.tags]
+            dup_count_cache[img_path] = Counter(tag_str_cache[img_path])
+
         # Update info
         if len(working_images) == 1:
-            img_name = self.app_manager.load_image_data(working_images[0]).name
+            img_name = image_data_cache[working_images[0]].name
             self.info_label.setText(f"Editing: {img_name}")
         else:
             self.info_label.setText(f"Editing: {len(working_images)} images")
 
-        # Cache image data to avoid repeated loading (performance optimization)
-        image_data_cache = {}
-        for img_path in working_images:
-            image_data_cache[img_path] = self.app_manager.load_image_data(img_path)
-
-        # Track tag occurrences efficiently
-        tag_occurrences = {}  # tag_str -> list of (tag_object, img_path)
-
-        for img_path, img_data in image_data_cache.items():
-            for tag in img_data.tags:
-                tag_str = str(tag)
-                if tag_str not in tag_occurrences:
-                    tag_occurrences[tag_str] = []
-                tag_occurrences[tag_str].append((tag, img_path))
+        # Keep per-image counts so single-tag changes can update rows in place
+        self._image_tag_counts = dup_count_cache
 
-        # Populate table based on number of images
+        # Build table rows based on number of images
+        rows = []
         if len(working_images) == 1:
             # Single image: show ALL tags including duplicates
-            img_data = image_data_cache[working_images[0]]
-            for idx, tag in enumerate(img_data.tags):
-                tag_str = str(tag)
+            img_path = working_images[0]
+            img_data = image_data_cache[img_path]
+            dup_counts = dup_count_cache[img_path]
+            for tag, tag_str in zip(img_data.tags, tag_str_cache[img_path]):
                 # Count duplicates in this single image
-                dup_count = sum(1 for t in img_data.tags if str(t) == tag_str)
+                dup_count = dup_counts[tag_str]
 
                 # Build count text
                 if dup_count > 1:
@@ -640,37 +1001,31 @@ class TagWindow(QWidget):
                 else:
                     count_text = ""
 
-                # Add row to table
-                self._add_tag_row(tag.category, tag.value, count_text, tag, idx)
+                rows.append([tag.category, tag.value, count_text, tag])
         else:
             # Multiple images: show unique tags with counts
-            for tag_str, occurrences in sorted(tag_occurrences.items()):
-                tag = occurrences[0][0]  # Use first occurrence as representative
-                count = len(occurrences)
-
-                # Count total occurrences across all selected images (including duplicates within images)
-                # Use cached data for performance
-                total_count = 0
-                for _, img_path in occurrences:
-                    img_data = image_data_cache[img_path]
-                    total_count += sum(1 for t in img_data.tags if str(t) == tag_str)
-
+            # tag_str -> [representative tag, occurrences, total count]
+            tag_counts = {}
+            for img_path, img_data in image_data_cache.items():
+                dup_counts = dup_count_cache[img_path]
+                for tag, tag_str in zip(img_data.tags, tag_str_cache[img_path]):
+                    entry = tag_counts.get(tag_str)
+                    if entry is None:
+                        # Use first occurrence as representative
+                        entry = tag_counts[tag_str] = [tag, 0, 0]
+                    entry[1] += 1
+                    # Each occurrence counts every copy in its image (including
+                    # duplicates), as for project-wide counts
+                    entry[2] += dup_counts[tag_str]
+
+            for tag_str, (tag, count, total_count) in sorted(tag_counts.items()):
                 # Build count text
-                if total_count > count:
-                    num_dups = total_count - count
-                    dup_word = "duplicate" if num_dups == 1 else "duplicates"
-                    count_text = f"{total_count}, {num_dups} {dup_word}"
-                else:
-                    count_text = str(count)
+                count_text = _format_count(count, total_count)
+                rows.append([tag.category, tag.value, count_text, tag])
 
-                # Add row to table
-                self._add_tag_row(tag.category, tag.value, count_text, tag, count)
-
-        # Don't clear search input - preserve user's search when reloading tags
-        # self.tag_search_input.clear()  # Commented out to preserve search
-
-        # Update visible tags based on active filter and current search
-        self._update_visible_tags()
+        # Populate table and update visible tags based on active filter and
+        # current search (don't clear search input - preserve user's search)
+        self._set_table_rows(rows)
 
         # Update quick add checkboxes if quick add is active
         if self.quick_add_group.isChecked():
@@ -678,73 +1033,81 @@ class TagWindow(QWidget):
 
         self._updating = False
 
-    def _add_tag_row(
-        self, category_str: str, tag_str: str, count_text: str, tag_obj, user_data
-    ):
-        """Add a row to the tags table"""
-        row = self.tags_table.rowCount()
-        self.tags_table.insertRow(row)
-
-        # Category column (editable)
-        category_item = QTableWidgetItem(category_str)
-        category_item.setData(Qt.UserRole, tag_obj)
-        category_item.setData(Qt.UserRole + 1, user_data)
-        self.tags_table.setItem(row, 0, category_item)
-
-        # Tag column (editable)
-        tag_item = QTableWidgetItem(tag_str)
-        tag_item.setData(Qt.UserRole, tag_obj)
-        tag_item.setData(Qt.UserRole + 1, user_data)
-        self.tags_table.setItem(row, 1, tag_item)
-
-        # Count column (read-only)
-        count_item = QTableWidgetItem(count_text)
-        count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-        self.tags_table.setItem(row, 2, count_item)
+    def _set_table_rows(self, rows: list):
+        """Replace the table rows and refilter, painting the table once"""
+        self.tags_table.setUpdatesEnabled(False)
+        try:
+            # Single model reset
+            self.tag_model.set_rows(rows)
+            self._fit_column_widths()
+            self._update_visible_tags()
+        finally:
+            self.tags_table.setUpdatesEnabled(True)
+        self.tags_table.viewport().update()
+
+    def _fit_column_widths(self):
+        """Size the Category and Count columns to their widest text
+
+        Only distinct texts are measured, so this stays cheap even for large
+        tables where most rows share a handful of categories.
+        """
+        metrics = self.tags_table.fontMetrics()
+        header = self.tags_table.horizontalHeader()
+        for column in (0, 2):
+            width = max(
+                (
+                    metrics.horizontalAdvance(text)
+                    for text in self.tag_model.column_texts(column)
+                ),
+                default=0,
+            )
+            header.resizeSection(
+                column, max(width + COLUMN_PADDING, header.sectionSizeHint(column))
+            )
 
     def _load_project_tags(self):
-        """Load all tags from the entire project with counts"""
+        """Load all tags from the entire project with counts
+
+        Counts come from the app manager's project tag index. Images not in
+        it yet are counted on the thread pool (image data already in memory is
+        handed over, the rest is read from disk there), keeping the window
+        responsive on large projects.
+        """
         # Get all images in project
         image_list = self.app_manager.get_image_list()
         if not image_list:
             return
 
-        all_images = image_list.get_all_paths()
-        if not all_images:
+        missing = self.app_manager.project_tags_to_index()
+        if not missing:
+            self._set_table_rows(
+                _project_tag_rows(self.app_manager.get_project_tag_index())
+            )
             return
 
-        # Track tag occurrences across project
-        tag_occurrences = {}  # tag_str -> list of (tag_object, img_path)
-
-        for img_path in all_images:
-            img_data = self.app_manager.load_image_data(img_path)
-            for tag in img_data.tags:
-                tag_str = str(tag)
-                if tag_str not in tag_occurrences:
-                    tag_occurrences[tag_str] = []
-                tag_occurrences[tag_str].append((tag, img_path))
-
-        # Populate table with project-wide counts
-        for tag_str, occurrences in sorted(tag_occurrences.items()):
-            tag = occurrences[0][0]  # Use first occurrence as representative
-            count = len(occurrences)
-
-            # Count total occurrences across all images (including duplicates)
-            total_count = 0
-            for _, img_path in occurrences:
-                img_data = self.app_manager.load_image_data(img_path)
-                total_count += sum(1 for t in img_data.tags if str(t) == tag_str)
-
-            # Build count text
-            if total_count > count:
-                num_dups = total_count - count
-                dup_word = "duplicate" if num_dups == 1 else "duplicates"
-                count_text = f"{total_count}, {num_dups} {dup_word}"
-            else:
-                count_text = str(count)
+        loaded_data = self.app_manager.get_loaded_image_data()
+        loaded_tags = {
+            img_path: list(loaded_data[img_path].tags)
+            for img_path in missing
+            if img_path in loaded_data
+        }
+        QThreadPool.globalInstance().start(
+            _ProjectTagsLoader(
+                self, self._project_tags_gen, missing, loaded_tags, image_list
+            )
+        )
 
-            # Add row to table
-            self._add_tag_row(tag.category, tag.value, count_text, tag, count)
+    def _apply_project_tags(self, generation: int, image_list, counted: dict):
+        """Index tag counts from the worker and show the project-wide rows
+        (stale results are dropped)"""
+        if generation != self._project_tags_gen:
+            return
+        self.app_manager.index_project_tags(image_list, counted)
+        self._updating = True
+        self._set_table_rows(
+            _project_tag_rows(self.app_manager.get_project_tag_index())
+        )
+        self._updating = False
 
     def _add_tag(self, category: str, value: str):
         """Add new tag to selected images"""
@@ -761,91 +1124,240 @@ class TagWindow(QWidget):
                 # User cancelled
                 return
 
-        for img_path in working_images:
-            img_data = self.app_manager.load_image_data(img_path)
-
+        changed_images = []
+        tag_str = f"{category}:{value}"
+        image_data_cache = self.app_manager.load_image_data_batch(working_images)
+        for img_path, img_data in image_data_cache.items():
             # Check if tag already exists (case-sensitive comparison)
-            tag_str = f"{category}:{value}"
-            tag_exists = any(str(tag) == tag_str for tag in img_data.tags)
+            tag_exists = tag_str in img_data.tag_str_set
 
             # Only add if tag doesn't exist
             if not tag_exists:
                 img_data.add_tag(category, value)
-                self.app_manager.save_image_data(img_path, img_data)
+                changed_images.append(img_path)
+        self.app_manager.save_image_data_batch(
+            {img_path: image_data_cache[img_path] for img_path in changed_images}
+        )
 
         # Clear inputs in widget (respecting keep_category mode)
         self.tag_entry_widget.cleanup_after_add()
 
-        self._load_tags()
+        self._apply_tag_changes(
+            working_images, [(Tag(category, value), changed_images, 1)]
+        )
+        self.app_manager.apply_tag_changes(
+            [], [Tag(category, value)] * len(changed_images)
+        )
+        self._refresh_after_mutation()
+
+    def _refresh_after_mutation(self):
+        """Schedule one suggestion and project refresh for the current edits
+
+        The tags table is already updated; edits made before control returns
+        to the event loop share a single refresh.
+        """
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Refresh suggestions and mark the project modified"""
         self._update_tag_suggestions()
-        self.app_manager.update_project(save=True)
+        self._update_project_in_place()
+
+    def _update_project_in_place(self):
+        """Mark the project modified without reloading the tags table again
+
+        Other views are notified once a burst of edits settles.
+        """
+        self._tags_updated_in_place = True
+        self.app_manager.mark_project_dirty()
+
+    def _apply_tag_changes(self, working_images, changes):
+        """Update the tags table after tags were added or removed
+
+        Args:
+            working_images: Images the table was loaded for
+            changes: List of (tag, changed_images, delta) where tag was added
+                (delta=1) or removed (delta=-1) once on each of changed_images
+
+        Multi-image tables are updated from the per-image tag counts kept by
+        _load_tags, touching only the rows for the changed tags. Single-image
+        tables list every occurrence in order, so they (and any table loaded
+        for other images) are reloaded instead.
+        """
+        if len(working_images) <= 1 or set(working_images) != set(
+            self._image_tag_counts
+        ):
+            self._load_tags()
+            return
+
+        changed_tags = {}  # tag_str -> representative tag
+        for tag, changed_images, delta in changes:
+            if not changed_images:
+                continue
+            tag_str = str(tag)
+            changed_tags.setdefault(tag_str, tag)
+            for img_path in changed_images:
+                counts = self._image_tag_counts[img_path]
+                counts[tag_str] += delta
+                if counts[tag_str] <= 0:
+                    del counts[tag_str]
+        if not changed_tags:
+            return
+
+        self._updating = True
+        for tag_str, tag in changed_tags.items():
+            # Same counting as _load_tags: one occurrence per tag instance, and
+            # each occurrence counts every copy of the tag in its image
+            count = 0
+            total_count = 0
+            for counts in self._image_tag_counts.values():
+                image_count = counts.get(tag_str, 0)
+                count += image_count
+                total_count += image_count * image_count
+
+            row = self.tag_model.find_row(tag.category, tag.value)
+            if count == 0:
+                if row >= 0:
+                    self.tag_model.remove_row(row)
+            elif row >= 0:
+                self.tag_model.set_count_text(row, _format_count(count, total_count))
+            else:
+                # Keep rows sorted by full tag string
+                row = 0
+                while row < self.tag_model.rowCount() and (
+                    f"{self.tag_model.text_at(row, 0)}:{self.tag_model.text_at(row, 1)}"
+                    < tag_str
+                ):
+                    row += 1
+                self.tag_model.insert_row(
+                    row,
+                    [tag.category, tag.value, _format_count(count, total_count), tag],
+                )
+
+        self._fit_column_widths()
+        self._update_visible_tags()
+        if self.quick_add_group.isChecked():
+            self._update_quick_add_checkboxes()
+        self._updating = False
+
+    def _apply_tag_mutations(self, working_images, mutations):
+        """Replace or remove tags in the working images and refresh the views
+
+        Args:
+            working_images: Images to change
+            mutations: List of (old_tag, new_tag) applied in order, each
+                replacing one occurrence of old_tag per image. A new_tag of
+                None removes the occurrence instead.
+
+        Each image is loaded once, and only the images that changed are
+        saved. The tags table and the project tag list are then updated for
+        the changed tags only.
+
+        Returns:
+            Tuple of (tag occurrences changed, images changed)
+        """
+        image_data_cache = self.app_manager.load_image_data_batch(working_images)
+        dirty = set()
+        changes = []  # (tag, changed_images, delta) for _apply_tag_changes
+
+        for old_tag, new_tag in mutations:
+            changed_images = []
+            for img_path, img_data in image_data_cache.items():
+                if new_tag is None:
+                    changed = img_data.remove_tag(old_tag)
+                else:
+                    # Each image gets its own Tag: tags are mutable (the spell
+                    # checker edits them)
+                    changed = img_data.replace_tag(
+                        old_tag, Tag(new_tag.category, new_tag.value)
+                    )
+                if changed:
+                    changed_images.append(img_path)
+            changes.append((old_tag, changed_images, -1))
+            if new_tag is not None:
+                changes.append((new_tag, changed_images, 1))
+            dirty.update(changed_images)
+
+        self.app_manager.save_image_data_batch(
+            {p: data for p, data in image_data_cache.items() if p in dirty}
+        )
+
+        removed = [tag for tag, images, delta in changes if delta < 0 for _ in images]
+        self._apply_tag_changes(working_images, changes)
+        self.app_manager.apply_tag_changes(
+            removed,
+            [tag for tag, images, delta in changes if delta > 0 for _ in images],
+        )
+        self._refresh_after_mutation()
+        return len(removed), len(dirty)
+
+    def _current_selected_rows(self) -> List[int]:
+        """Model rows of the selected table rows, in order"""
+        # Rows are selected whole, so one index per row is enough
+        return sorted(
+            self.tag_proxy.mapToSource(index).row()
+            for index in self.tags_table.selectionModel().selectedRows()
+        )
 
-    def _edit_tag(self, item: QTableWidgetItem):
+    def _edit_tag(self, index: QModelIndex):
         """Edit an existing tag"""
-        if not item:
+        if not index.isValid():
             return
 
         # Allow editing category (column 0) or tag (column 1) columns
-        if item.column() not in [0, 1]:
+        if index.column() not in [0, 1]:
             return
 
-        old_tag = item.data(Qt.UserRole)
+        source_index = self.tag_proxy.mapToSource(index)
+        old_tag = self.tag_model.tag_at(source_index.row())
         if not old_tag:
             return
 
-        # Store the current selection before any changes
-        # This handles the case where double-click clears multi-selection
-        self._stored_selection = set()
-        for selected_item in self.tags_table.selectedItems():
-            self._stored_selection.add(selected_item.row())
-
+        # Store the current selection before any changes (as model rows)
+        # This handles the case where double-click clears multi-selection.
         # If no explicit selection, at least include the clicked row
-        if not self._stored_selection:
-            self._stored_selection.add(item.row())
-
-        # Disconnect any existing itemChanged connections to prevent multiple handlers
-        try:
-            self.tags_table.itemChanged.disconnect()
-        except:
-            pass
-
-        # Item is already editable, just trigger edit mode
-        self.tags_table.editItem(item)
+        self._stored_selection = tuple(self._current_selected_rows()) or (
+            source_index.row(),
+        )
 
-        # Connect to item changed signal with the old tag stored
-        self.tags_table.itemChanged.connect(lambda it: self._on_tag_edited(it, old_tag))
+        # Remember the old tag for _on_tag_edited_dispatch
+        self._editing_old_tag = old_tag
+        self._editing_row = source_index.row()
 
-    def _on_tag_edited(self, item: QTableWidgetItem, old_tag: Tag):
-        """Handle tag edit completion"""
-        try:
-            self.tags_table.itemChanged.disconnect()
-        except:
-            pass
+        # Cell is already editable, just trigger edit mode
+        self.tags_table.edit(index)
 
-        if not item:
+    def _on_tag_edited_dispatch(self, row: int, column: int):
+        """Route a model edit started by _edit_tag to _on_tag_edited"""
+        old_tag = self._editing_old_tag
+        if old_tag is None or row != self._editing_row:
+            # Not the edit started by _edit_tag (e.g. reverting a cancelled edit)
             return
+        self._editing_old_tag = None
+        self._editing_row = None
+        self._on_tag_edited(row, column, old_tag)
 
+    def _on_tag_edited(self, row: int, column: int, old_tag: Tag):
+        """Handle tag edit completion"""
         # Only process changes to category (column 0) or tag (column 1) columns
-        if item.column() not in [0, 1]:
+        if column not in [0, 1]:
             return
 
-        new_text = item.text().strip()
+        new_text = self.tag_model.text_at(row, column).strip()
         current_view = self.app_manager.get_current_view()
         working_images = current_view.get_working_images() if current_view else []
 
         # Get selected rows for multi-select editing
         # Use stored selection from when editing started (handles double-click clearing selection)
-        selected_rows = getattr(self, "_stored_selection", set())
+        selected_rows = self._stored_selection
 
         # If no stored selection, fall back to current selection
         if not selected_rows:
-            selected_rows = set()
-            for selected_item in self.tags_table.selectedItems():
-                selected_rows.add(selected_item.row())
+            selected_rows = self._current_selected_rows()
 
-        # If still no selection, use the clicked row
+        # If still no selection, use the edited row
         if not selected_rows:
-            selected_rows = {item.row()}
+            selected_rows = [row]
         # If only one row is selected and it's the clicked row, that's fine
         # If multiple rows are selected, use all of them
 
@@ -854,74 +1366,45 @@ class TagWindow(QWidget):
         if multi_edit_warning:
             count = max(len(selected_rows), len(working_images))
             if not self._show_multi_select_warning(count):
-                # User cancelled - revert the edited item
-                if item.column() == 0:  # Category column
-                    item.setText(old_tag.category)
+                # User cancelled - revert the edited cell
+                index = self.tag_model.index(row, column)
+                if column == 0:  # Category column
+                    self.tag_model.setData(index, old_tag.category)
                 else:  # Tag column
-                    item.setText(old_tag.value)
+                    self.tag_model.setData(index, old_tag.value)
                 return
 
         # Process each selected row
-        for row in selected_rows:
-            # Get the tag data for this row
-            category_item = self.tags_table.item(row, 0)
-            tag_item = self.tags_table.item(row, 1)
-
-            if not category_item or not tag_item:
-                continue
-
+        mutations = []
+        for selected_row in selected_rows:
             # Get the old tag for this row
-            row_old_tag = category_item.data(Qt.UserRole)
+            row_old_tag = self.tag_model.tag_at(selected_row)
             if not row_old_tag:
                 continue
 
             # Determine the new category and value based on what was edited
-            if item.column() == 0:  # Editing category
+            if column == 0:  # Editing category
                 new_category = new_text
-                new_value = tag_item.text().strip()
+                new_value = self.tag_model.text_at(selected_row, 1).strip()
             else:  # Editing tag value
-                new_category = category_item.text().strip()
+                new_category = self.tag_model.text_at(selected_row, 0).strip()
                 new_value = new_text
 
             if not new_category or not new_value:
                 # Delete tag from all images
-                for img_path in working_images:
-                    img_data = self.app_manager.load_image_data(img_path)
-                    if row_old_tag in img_data.tags:
-                        img_data.remove_tag(row_old_tag)
-                        self.app_manager.save_image_data(img_path, img_data)
+                mutations.append((row_old_tag, None))
             else:
                 # Update tag in all images
-                for img_path in working_images:
-                    img_data = self.app_manager.load_image_data(img_path)
-                    # Remove old tag and add new tag
-                    if row_old_tag in img_data.tags:
-                        idx = img_data.tags.index(row_old_tag)
-                        img_data.tags[idx] = Tag(new_category, new_value)
-                        self.app_manager.save_image_data(img_path, img_data)
-
-        # Rebuild tag list from all images to reflect changes
-        self.app_manager.rebuild_tag_list()
+                mutations.append((row_old_tag, Tag(new_category, new_value)))
 
-        # Preserve current search text before reloading
-        current_search = self.tag_search_input.text().strip()
-
-        # Reload tags
-        self._load_tags()
-
-        # Restore search text and update suggestions
-        if current_search:
-            self.tag_search_input.setText(current_search)
-        # If no search was active, leave search box empty
-        self._update_tag_suggestions()
-        self.app_manager.update_project(save=True)
+        # The edited cell still shows the new text; rows are updated from the tags
+        self.tag_model.revert_row(row)
+        self._apply_tag_mutations(working_images, mutations)
 
     def _delete_tag(self):
         """Delete all selected tags from all working images"""
         # Get all selected rows (not just currentRow)
-        selected_rows = set()
-        for item in self.tags_table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = self._current_selected_rows()
 
         if not selected_rows:
             return
@@ -929,11 +1412,9 @@ class TagWindow(QWidget):
         # Collect all tags to delete from selected rows
         tags_to_delete = []
         for row in selected_rows:
-            tag_item = self.tags_table.item(row, 0)
-            if tag_item:
-                tag_to_delete = tag_item.data(Qt.UserRole)
-                if tag_to_delete:
-                    tags_to_delete.append(tag_to_delete)
+            tag_to_delete = self.tag_model.tag_at(row)
+            if tag_to_delete:
+                tags_to_delete.append(tag_to_delete)
 
         if not tags_to_delete:
             return
@@ -948,27 +1429,14 @@ class TagWindow(QWidget):
                 return
 
         # Delete all selected tags from all images
-        for img_path in working_images:
-            img_data = self.app_manager.load_image_data(img_path)
-            for tag_to_delete in tags_to_delete:
-                if tag_to_delete in img_data.tags:
-                    img_data.remove_tag(tag_to_delete)
-            self.app_manager.save_image_data(img_path, img_data)
-
-        # Rebuild tag list from all images to reflect deletions
-        self.app_manager.rebuild_tag_list()
-
-        # Reload tags
-        self._load_tags()
-        self._update_tag_suggestions()
-        self.app_manager.update_project(save=True)
+        self._apply_tag_mutations(
+            working_images, [(tag, None) for tag in tags_to_delete]
+        )
 
     def _show_tags_context_menu(self, position):
         """Show context menu for tags table on right-click"""
         # Get selected rows
-        selected_rows = set()
-        for item in self.tags_table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = self._current_selected_rows()
 
         if not selected_rows:
             return  # No selection
@@ -976,14 +1444,11 @@ class TagWindow(QWidget):
         # Get full tag strings (category:value) from selected rows
         selected_tags = []
         for row in selected_rows:
-            category_item = self.tags_table.item(row, 0)  # Category column
-            tag_item = self.tags_table.item(row, 1)  # Tag column
-            if category_item and tag_item:
-                category = category_item.text().strip()
-                tag_value = tag_item.text().strip()
-                if category and tag_value:
-                    full_tag = f"{category}:{tag_value}"
-                    selected_tags.append(full_tag)
+            category = self.tag_model.text_at(row, 0).strip()  # Category column
+            tag_value = self.tag_model.text_at(row, 1).strip()  # Tag column
+            if category and tag_value:
+                full_tag = f"{category}:{tag_value}"
+                selected_tags.append(full_tag)
 
         if not selected_tags:
             return
@@ -995,7 +1460,7 @@ class TagWindow(QWidget):
         edit_category_action = QAction("Edit Category (Batch)", self)
         edit_category_action.setToolTip("Edit category for all selected tags")
         edit_category_action.triggered.connect(
-            lambda: self._batch_edit_column(list(selected_rows), 0)
+            lambda: self._batch_edit_column(selected_rows, 0)
         )
         menu.addAction(edit_category_action)
 
@@ -1003,7 +1468,7 @@ class TagWindow(QWidget):
         edit_tag_action = QAction("Edit Tag (Batch)", self)
         edit_tag_action.setToolTip("Edit tag value for all selected tags")
         edit_tag_action.triggered.connect(
-            lambda: self._batch_edit_column(list(selected_rows), 1)
+            lambda: self._batch_edit_column(selected_rows, 1)
         )
         menu.addAction(edit_tag_action)
 
@@ -1038,18 +1503,14 @@ class TagWindow(QWidget):
         row_data = []  # Store (row, category, tag) for later processing
 
         for row in selected_rows:
-            category_item = self.tags_table.item(row, 0)
-            tag_item = self.tags_table.item(row, 1)
-
-            if category_item and tag_item:
-                category = category_item.text().strip()
-                tag_value = tag_item.text().strip()
-                row_data.append((row, category, tag_value))
+            category = self.tag_model.text_at(row, 0).strip()
+            tag_value = self.tag_model.text_at(row, 1).strip()
+            row_data.append((row, category, tag_value))
 
-                if column == 0:
-                    current_values.add(category)
-                else:
-                    current_values.add(tag_value)
+            if column == 0:
+                current_values.add(category)
+            else:
+                current_values.add(tag_value)
 
         if not row_data:
             return
@@ -1119,20 +1580,13 @@ class TagWindow(QWidget):
 
         # Show dialog and wait for result
         result = dialog.exec_()
-        print(f"\n[BATCH_EDIT_DEBUG] Dialog exec() returned: {result}")
-        print(f"[BATCH_EDIT_DEBUG] Checking if result == 1: {result == 1}")
 
         if result != 1:  # QDialog.Accepted is 1
-            print(f"[BATCH_EDIT_DEBUG] Dialog not accepted, returning early")
             return
 
         new_value = new_value_input.text().strip()
-        print(f"[BATCH_EDIT_DEBUG] Got new value: '{new_value}'")
 
         if not new_value:
-            print(
-                f"[BATCH_EDIT_DEBUG] New value is empty, showing warning and returning"
-            )
             QMessageBox.warning(
                 self, "Empty Value", f"Please enter a new {column_name.lower()}."
             )
@@ -1148,24 +1602,11 @@ class TagWindow(QWidget):
                 return
 
         # Process each selected row
-        print(
-            f"[DEBUG] Starting batch edit: {len(row_data)} rows, column={column}, new_value='{new_value}'"
-        )
-        print(f"[DEBUG] Working images count: {len(working_images)}")
-
-        tags_updated_count = 0
-
+        mutations = []
         for row, old_category, old_tag_value in row_data:
             # Get the tag object
-            category_item = self.tags_table.item(row, 0)
-            old_tag = category_item.data(Qt.UserRole) if category_item else None
-
-            print(
-                f"[DEBUG] Processing row {row}: category='{old_category}', tag='{old_tag_value}', old_tag={old_tag}"
-            )
-
+            old_tag = self.tag_model.tag_at(row)
             if not old_tag:
-                print(f"[DEBUG] No tag object found, skipping row {row}")
                 continue
 
             # Determine new category and value
@@ -1176,29 +1617,16 @@ class TagWindow(QWidget):
                 new_category = old_category
                 new_tag_value = new_value
 
-            print(f"[DEBUG] New tag: {new_category}:{new_tag_value}")
-
             # Update tag in all working images
-            for img_path in working_images:
-                img_data = self.app_manager.load_image_data(img_path)
-
-                # Find and replace the tag
-                if old_tag in img_data.tags:
-                    idx = img_data.tags.index(old_tag)
-                    from .data_models import Tag
-
-                    img_data.tags[idx] = Tag(new_category, new_tag_value)
-                    self.app_manager.save_image_data(img_path, img_data)
-                    tags_updated_count += 1
-                    print(f"[DEBUG] Updated tag in {img_path}")
-                else:
-                    print(f"[DEBUG] Old tag {old_tag} not found in {img_path}")
+            mutations.append((old_tag, Tag(new_category, new_tag_value)))
 
-        # Rebuild tag list and reload
-        self.app_manager.rebuild_tag_list()
-        self._load_tags()
-        self._update_tag_suggestions()
-        self.app_manager.update_project(save=True)
+        tags_updated_count, images_updated_count = self._apply_tag_mutations(
+            working_images, mutations
+        )
+        print(
+            f"[DEBUG] Batch edit: {len(row_data)} rows, "
+            f"{tags_updated_count} tags updated in {images_updated_count} images"
+        )
 
         QMessageBox.information(
             self,
@@ -1237,36 +1665,52 @@ class TagWindow(QWidget):
             new_filter = tag_expression
 
         # Apply the new filter
-        from .saved_filters_dialog import SavedFiltersDialog
-        from .filter_parser import evaluate_filter
-
         image_list = self.app_manager.get_image_list()
         if not image_list:
             return
 
-        # Filter images
-        all_images = image_list.get_all_paths()
+        # Filter images, parsing the expression once for all of them
         filtered = []
+        try:
+            predicate = compile_filter(new_filter)
+        except ValueError as e:
+            # Nothing can match an invalid expression
+            print(f"ERROR: Invalid filter expression {new_filter!r}: {e}")
+            predicate = None
+
+        if predicate is None:
+            all_images = []
+        else:
+            # Only images having one of the tags can match, and the tag index
+            # finds those without reading every image
+            literals = literal_alternatives(parse_filter(tag_expression))
+            if literals is None:
+                all_images = image_list.get_all_paths()
+            else:
+                all_images = self.app_manager.images_with_any_tag(literals)
 
-        for img_path in all_images:
-            try:
-                img_data = self.app_manager.load_image_data(img_path)
-                img_tag_strs = [str(tag) for tag in img_data.tags]
-                result = evaluate_filter(new_filter, img_tag_strs)
-
-                if result:
-                    filtered.append(img_path)
-            except Exception as e:
+        # Read image data in chunks so disk reads overlap without holding every image
+        for start in range(0, len(all_images), 512):
+            errors = {}
+            chunk = self.app_manager.load_image_data_batch(
+                all_images[start : start + 512], errors
+            )
+            for img_path, e in errors.items():
                 print(f"ERROR: Error filtering image {img_path}: {e}")
-                continue
 
-        # Create filtered view (always create, even if empty)
-        from .data_models import ImageList
+            for img_path, img_data in chunk.items():
+                try:
+                    # Cached per image; filters ignore tag order
+                    if predicate(img_data.tag_str_set):
+                        filtered.append(img_path)
+                except Exception as e:
+                    print(f"ERROR: Error filtering image {img_path}: {e}")
+                    continue
 
+        # Update filtered view (always set, even if empty)
         base_dir = image_list._base_dir
         if base_dir:
-            filtered_view = ImageList.create_filtered(base_dir, filtered)
-            self.app_manager.set_filtered_view(filtered_view)
+            self.app_manager.set_filtered_paths(base_dir, filtered)
             self.app_manager.current_filter_expression = new_filter
             print(f"[DEBUG] Added tags to gallery filter: {len(filtered)} images match")
 
@@ -1303,26 +1747,16 @@ class TagWindow(QWidget):
                 self._multi_select_warned = False
                 return True
 
-            elif key == Qt.Key_Down:
-                # Navigate down in list with wrap-around
-                current_row = self.quick_add_list.currentRow()
-                if current_row == self.quick_add_list.count() - 1:
-                    # At bottom, wrap to top
-                    self.quick_add_list.setCurrentRow(0)
-                else:
-                    # Move down
-                    self.quick_add_list.setCurrentRow(current_row + 1)
-                return True
-
-            elif key == Qt.Key_Up:
-                # Navigate up in list with wrap-around
-                current_row = self.quick_add_list.currentRow()
-                if current_row == 0:
-                    # At top, wrap to bottom
-                    self.quick_add_list.setCurrentRow(self.quick_add_list.count() - 1)
-                else:
-                    # Move up
-                    self.quick_add_list.setCurrentRow(current_row - 1)
+            elif key == Qt.Key_Down or key == Qt.Key_Up:
+                # Navigate with wrap-around (Qt's own handling stops at the ends)
+                count = self.quick_add_list.count()
+                if count:
+                    step = 1 if key == Qt.Key_Down else -1
+                    current_row = self.quick_add_list.currentRow()
+                    if current_row < 0 and step < 0:
+                        # Nothing current yet - Up starts from the bottom
+                        current_row = 0
+                    self.quick_add_list.setCurrentRow((current_row + step) % count)
                 return True
 
             elif key == Qt.Key_Left:
@@ -1375,7 +1809,7 @@ class TagWindow(QWidget):
 
         # Hide suggestions after acceptance
         self.tag_entry_widget.suggestion_list.clear()
-        self.tag_entry_widget.suggestion_list.setVisible(False)
+        self.tag_entry_widget.hide_suggestions()
 
     def keyPressEvent(self, event):
         """Handle keyboard events at window level"""
@@ -1389,46 +1823,61 @@ class TagWindow(QWidget):
         if not current_view or not main_image_list:
             return
 
-        all_images = current_view.get_all_paths()
         active_image = current_view.get_active()
 
-        if not all_images or not active_image:
+        if not len(current_view) or not active_image:
             return
 
         try:
-            current_idx = all_images.index(active_image)
-            new_idx = (current_idx + direction) % len(all_images)  # Wrap around
+            current_idx = current_view.get_index(active_image)
+            if current_idx is None:
+                return
+            new_idx = (current_idx + direction) % len(current_view)  # Wrap around
 
-            new_active = all_images[new_idx]
+            new_active = current_view[new_idx]
+            if new_active == active_image:
+                # Only one image in the view, nothing to change or refresh
+                return
 
             # Set active on current view (for filtered navigation)
             current_view.set_active(new_active)
             # Also set on main image list to ensure signals work
-            if main_image_list != current_view:
+            if main_image_list is not current_view:
                 main_image_list.set_active(new_active)
 
             # Directly update gallery selection
-            from .gallery import Gallery
-
-            current_widget = self.parent()
-            gallery = None
-
-            while current_widget:
-                if hasattr(current_widget, "findChildren"):
-                    galleries = current_widget.findChildren(Gallery)
-                    if galleries:
-                        gallery = galleries[0]
-                        break
-                current_widget = current_widget.parent()
-
+            gallery = self._find_gallery()
             if gallery and hasattr(gallery, "_on_active_image_changed"):
                 gallery._on_active_image_changed()
 
         except (ValueError, IndexError):
             pass
 
+    def _find_gallery(self):
+        """Gallery next to this window, searched once and then remembered"""
+        gallery = self._gallery_ref() if self._gallery_ref else None
+        if gallery is not None:
+            try:
+                # Raises if the Qt object behind the wrapper was deleted
+                gallery.objectName()
+                return gallery
+            except RuntimeError:
+                pass
+
+        self._gallery_ref = None
+        current_widget = self.parent()
+        while current_widget:
+            if hasattr(current_widget, "findChildren"):
+                galleries = current_widget.findChildren(Gallery)
+                if galleries:
+                    self._gallery_ref = weakref.ref(galleries[0])
+                    return galleries[0]
+            current_widget = current_widget.parent()
+        return None
+
     def showEvent(self, event):
         """Update when window is shown"""
         super().showEvent(event)
         self._update_tag_suggestions()
-        self._load_tags()
+        if self._tags_stale:
+            self._load_tags()
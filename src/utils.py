@@ -3,11 +3,55 @@ Utility functions for image tagging application
 """
 
 import hashlib
+import heapq
 import re
 import os
+import sys
+import threading
+from array import array
 from pathlib import Path
 from typing import List, Tuple, Optional
-from difflib import SequenceMatcher
+
+# Reusable per-thread DP rows for bounded_levenshtein (grown on demand, never
+# shrunk) so searches can run on worker threads
+_lev_local = threading.local()
+
+# Fuzzy-only matches (no exact/prefix/substring hit) below this ratio are skipped
+FUZZY_MIN_RATIO = 0.6
+
+# Longest query scored with the bit-parallel myers_levenshtein (one machine word)
+MYERS_MAX_QUERY = 64
+
+# Candidate count above which the compiled kernel (if available) scores the scan
+KERNEL_MIN_CANDIDATES = 256
+
+# Lazily imported compiled scoring backend, fuzzy_rapidfuzz or fuzzy_kernel
+# (False once both imports have failed)
+_fuzzy_kernel = None
+
+# Numba's default threading layer must not be entered from two threads at once
+_kernel_lock = threading.Lock()
+
+
+def _get_fuzzy_kernel():
+    """
+    Return the compiled scoring backend: fuzzy_rapidfuzz if rapidfuzz is
+    installed, else fuzzy_kernel if numba is, else None
+    """
+    global _fuzzy_kernel
+    if _fuzzy_kernel is None:
+        try:
+            from . import fuzzy_rapidfuzz
+
+            _fuzzy_kernel = fuzzy_rapidfuzz
+        except ImportError:
+            try:
+                from . import fuzzy_kernel
+
+                _fuzzy_kernel = fuzzy_kernel
+            except ImportError:
+                _fuzzy_kernel = False
+    return _fuzzy_kernel or None
 
 
 def hash_image(image_path: Path, hash_length: int = 16) -> str:
@@ -114,88 +158,660 @@ def split_sequential_filename(filename: str) -> Tuple[str, Optional[int]]:
     return stem, None
 
 
+def bounded_levenshtein(a: str, b: str, max_dist: int) -> int:
+    """
+    Levenshtein distance with an upper bound (Ukkonen band + early exit)
+
+    Only cells within max_dist of the diagonal are computed, using two rolling
+    rows, and the scan stops as soon as every cell of a row exceeds max_dist.
+
+    Args:
+        a: First string
+        b: Second string
+        max_dist: Largest distance of interest
+
+    Returns:
+        Edit distance, or max_dist + 1 if the distance exceeds max_dist
+    """
+    n, m = len(a), len(b)
+    limit = max_dist + 1
+    if abs(n - m) > max_dist:
+        return limit
+
+    # Iterate rows over the shorter string
+    if n > m:
+        a, b, n, m = b, a, m, n
+    if n == 0:
+        return m
+
+    rows = getattr(_lev_local, "rows", None)
+    if rows is None:
+        rows = _lev_local.rows = (array("i"), array("i"))
+    prev, curr = rows
+    if len(prev) <= m:
+        grow = [0] * (m + 1 - len(prev))
+        prev.extend(grow)
+        curr.extend(grow)
+
+    for j in range(min(m, limit) + 1):
+        prev[j] = j if j <= max_dist else limit
+
+    for i in range(1, n + 1):
+        ca = a[i - 1]
+        lo = i - max_dist if i > max_dist else 1
+        hi = i + max_dist if i + max_dist < m else m
+
+        left = i if lo == 1 else limit
+        curr[lo - 1] = left
+        row_min = left
+        diag = prev[lo - 1]
+
+        for j in range(lo, hi + 1):
+            above = prev[j]
+            best = diag + (ca != b[j - 1])
+            if above + 1 < best:
+                best = above + 1
+            if left + 1 < best:
+                best = left + 1
+            curr[j] = best
+            left = best
+            diag = above
+            if best < row_min:
+                row_min = best
+
+        # Cell just outside the band is read by the next row
+        if hi < m:
+            curr[hi + 1] = limit
+
+        if row_min > max_dist:
+            return limit
+
+        prev, curr = curr, prev
+
+    dist = prev[m]
+    return dist if dist <= max_dist else limit
+
+
+def myers_pattern(query: str) -> dict:
+    """Per-character position bitmasks of query for myers_levenshtein"""
+    peq = {}
+    bit = 1
+    for c in query:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    return peq
+
+
+def myers_levenshtein(peq: dict, n: int, b: str, max_dist: int) -> int:
+    """
+    Bounded Levenshtein distance using Myers' bit-parallel algorithm
+
+    A whole DP column is held in the bits of two integers and advanced with a
+    handful of bitwise operations per character of b, which beats the banded
+    DP for short queries (up to MYERS_MAX_QUERY characters).
+
+    Args:
+        peq: myers_pattern() of the query
+        n: Length of the query
+        b: String to compare against
+        max_dist: Largest distance of interest
+
+    Returns:
+        Edit distance, or max_dist + 1 if the distance exceeds max_dist
+    """
+    limit = max_dist + 1
+    remaining = len(b)
+    if abs(n - remaining) > max_dist:
+        return limit
+    if n == 0:
+        return remaining
+
+    full = (1 << n) - 1
+    last = 1 << (n - 1)
+    vp = full
+    vn = 0
+    score = n
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (full & ~(xh | vp))
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+
+        # Each remaining character can lower the distance by at most one
+        remaining -= 1
+        if score - remaining > max_dist:
+            return limit
+
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | (full & ~(xv | hp))
+        vn = hp & xv
+
+    return score if score <= max_dist else limit
+
+
+def _lev_k1(a: str, b: str) -> int:
+    """Levenshtein distance specialized for max_dist=1 (returns 2 if over)"""
+    if a == b:
+        return 0
+    n, m = len(a), len(b)
+    if n == m:
+        # One substitution: everything after the first mismatch must agree
+        i = 0
+        while a[i] == b[i]:
+            i += 1
+        return 1 if a[i + 1 :] == b[i + 1 :] else 2
+    if n < m:
+        a, b, n, m = b, a, m, n
+    if n - m > 1:
+        return 2
+    # One deletion from the longer string at the first mismatch
+    i = 0
+    while i < m and a[i] == b[i]:
+        i += 1
+    return 1 if a[i + 1 :] == b[i:] else 2
+
+
+def _lev_k2(a: str, b: str) -> int:
+    """Levenshtein distance specialized for max_dist=2 (returns 3 if over)"""
+    if abs(len(a) - len(b)) > 2:
+        return 3
+
+    # Strip the common prefix and suffix; they never need editing
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    j = 0
+    while j < n - i and a[-1 - j] == b[-1 - j]:
+        j += 1
+    a = a[i : len(a) - j]
+    b = b[i : len(b) - j]
+    if not a or not b:
+        dist = len(a) + len(b)
+        return dist if dist <= 2 else 3
+
+    # First characters differ: substitute, delete or insert, then at most one
+    # more edit remains
+    best = min(_lev_k1(a[1:], b[1:]), _lev_k1(a[1:], b), _lev_k1(a, b[1:]))
+    return best + 1 if best < 2 else 3
+
+
+def _charmask(text: str) -> int:
+    """64-bit character presence mask (code points folded modulo 64)"""
+    mask = 0
+    for c in text:
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+class _TrieNode:
+    """Prefix trie node listing every candidate id in its subtree (ascending)
+    and the ids of strings ending at the node"""
+
+    __slots__ = ("children", "ids", "ends")
+
+    def __init__(self):
+        self.children = {}
+        self.ids: List[int] = []
+        self.ends: List[int] = []
+
+
+def _build_trie(strings: List[str]) -> _TrieNode:
+    """Build a prefix trie mapping each prefix to the ids of strings below it"""
+    root = _TrieNode()
+    for i, text in enumerate(strings):
+        node = root
+        node.ids.append(i)
+        for c in text:
+            child = node.children.get(c)
+            if child is None:
+                child = node.children[c] = _TrieNode()
+            child.ids.append(i)
+            node = child
+        node.ends.append(i)
+    return root
+
+
+class FuzzySearchIndex:
+    """
+    Precomputed per-candidate data for repeated fuzzy searches
+
+    Holds parallel arrays (lowercased text, category/value split, lengths and
+    character bitmasks) so callers that search the same candidates on every
+    keystroke only pay for normalization once.
+    """
+
+    def __init__(self, candidates: List[str]):
+        self.candidates: List[str] = list(candidates)
+        self.lower: List[str] = [c.lower() for c in self.candidates]
+        self.lengths = array("i", map(len, self.lower))
+
+        self.has_category: List[bool] = []
+        self.categories: List[str] = []
+        self.values: List[str] = []
+        for candidate_lower in self.lower:
+            parts = candidate_lower.split(":", 1)
+            has_category = len(parts) > 1
+            self.has_category.append(has_category)
+            # Interned: few distinct categories, compared by identity first
+            self.categories.append(sys.intern(parts[0]) if has_category else "")
+            self.values.append(parts[1] if has_category else candidate_lower)
+
+        self.charmasks: List[int] = [_charmask(t) for t in self.lower]
+        self.value_charmasks: List[int] = [_charmask(t) for t in self.values]
+
+        # Prefix tries are only needed for top-N searches, build on first use
+        self._full_trie: Optional[_TrieNode] = None
+        self._value_trie: Optional[_TrieNode] = None
+
+        # 3-gram postings over the lowercased text, built on first use
+        self._trigrams: Optional[dict] = None
+
+        # Candidate ids grouped by text length and by value length, built on
+        # first use
+        self._ids_by_length: Optional[Tuple[dict, dict]] = None
+
+        # Candidates encoded for the compiled backend, built on first use
+        self._packed = None
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def packed(self, kernel):
+        """
+        Encodings of the lowercased candidates and of their value parts, for
+        the compiled backend
+
+        Args:
+            kernel: Backend module from _get_fuzzy_kernel
+
+        Returns:
+            Tuple of (full, values), each as returned by kernel.encode_strings
+        """
+        if self._packed is None:
+            self._packed = (
+                kernel.encode_strings(self.lower),
+                kernel.encode_strings(self.values),
+            )
+        return self._packed
+
+    def substring_ids(self, text: str) -> List[int]:
+        """
+        Ids of candidates whose lowercased text contains text
+
+        Intersects the 3-gram posting lists of text and verifies the
+        survivors, so only candidates sharing every 3-gram are compared.
+
+        Args:
+            text: Lowercased substring, at least 3 characters long
+
+        Returns:
+            Sorted list of candidate ids
+        """
+        if self._trigrams is None:
+            trigrams = {}
+            for i, candidate_lower in enumerate(self.lower):
+                for gram in {
+                    candidate_lower[j : j + 3]
+                    for j in range(len(candidate_lower) - 2)
+                }:
+                    postings = trigrams.get(gram)
+                    if postings is None:
+                        postings = trigrams[gram] = array("i")
+                    postings.append(i)
+            self._trigrams = trigrams
+
+        postings = []
+        for gram in {text[j : j + 3] for j in range(len(text) - 2)}:
+            ids = self._trigrams.get(gram)
+            if ids is None:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids.intersection_update(other)
+            if not ids:
+                return []
+        return [i for i in sorted(ids) if text in self.lower[i]]
+
+    def length_band_ids(
+        self, length: int, min_ratio: float, include_full: bool = True
+    ) -> List[int]:
+        """
+        Ids of candidates whose value part (or full text) is close enough in
+        length to reach min_ratio against a query of the given length
+
+        Every length difference costs one edit, so candidates outside the
+        band cannot be fuzzy matches and need not be scored.
+
+        Args:
+            length: Query length
+            min_ratio: Minimum similarity a fuzzy match must reach
+            include_full: Also test the length of the full "category:value" text
+
+        Returns:
+            Sorted list of candidate ids
+        """
+        if self._ids_by_length is None:
+            by_full, by_value = {}, {}
+            for i, (full_length, value) in enumerate(zip(self.lengths, self.values)):
+                by_full.setdefault(full_length, []).append(i)
+                by_value.setdefault(len(value), []).append(i)
+            self._ids_by_length = (by_full, by_value)
+
+        by_full, by_value = self._ids_by_length
+        groups = [by_value, by_full] if include_full else [by_value]
+        ids = set()
+        for by_length in groups:
+            for other, group in by_length.items():
+                longest = max(length, other)
+                if abs(length - other) <= int((1.0 - min_ratio) * longest + 1e-9):
+                    ids.update(group)
+        return sorted(ids)
+
+    def _trie_nodes(self, text: str, include_values: bool) -> List[_TrieNode]:
+        """Trie nodes reached by text in the full (and value) tries"""
+        if self._full_trie is None:
+            # Value trie first: another thread may already see _full_trie set
+            self._value_trie = _build_trie(self.values)
+            self._full_trie = _build_trie(self.lower)
+
+        tries = [self._full_trie]
+        if include_values:
+            tries.append(self._value_trie)
+
+        nodes = []
+        for node in tries:
+            for c in text:
+                node = node.children.get(c)
+                if node is None:
+                    break
+            else:
+                nodes.append(node)
+        return nodes
+
+    def prefix_ids(
+        self, prefix: str, include_values: bool = True, limit: Optional[int] = None
+    ) -> List[int]:
+        """
+        Ids of candidates whose lowercased text (or value part) starts with prefix
+
+        Args:
+            prefix: Lowercased prefix
+            include_values: Also match against the value part after "category:"
+            limit: Only return the first limit ids
+
+        Returns:
+            Sorted list of candidate ids
+        """
+        nodes = self._trie_nodes(prefix, include_values)
+        if len(nodes) == 1:
+            # Nodes list their ids in ascending order already
+            return nodes[0].ids[:limit]
+
+        ids = []
+        for i in heapq.merge(*(node.ids for node in nodes)):
+            if ids and ids[-1] == i:
+                continue
+            if limit is not None and len(ids) >= limit:
+                break
+            ids.append(i)
+        return ids
+
+    def exact_ids(self, text: str, include_values: bool = True) -> List[int]:
+        """
+        Ids of candidates whose lowercased text (or value part) equals text
+
+        Args:
+            text: Lowercased text
+            include_values: Also match against the value part after "category:"
+
+        Returns:
+            Sorted list of candidate ids
+        """
+        return sorted(
+            {i for node in self._trie_nodes(text, include_values) for i in node.ends}
+        )
+
+
+def _best_similarity(
+    query: str,
+    targets: Tuple[str, ...],
+    min_ratio: float,
+    query_mask: int = 0,
+    target_masks: Tuple[int, ...] = (),
+    query_peq: Optional[dict] = None,
+) -> float:
+    """
+    Best normalized Levenshtein similarity (1 - dist / longest) of query
+    against any target, or 0.0 if none reaches min_ratio
+
+    Each query character missing from a target costs at least one edit, so
+    targets whose bitmask misses more characters than the edit budget are
+    rejected before running the DP. When query_peq (myers_pattern of query)
+    is given, distances use the bit-parallel algorithm.
+    """
+    best = 0.0
+    for i, target in enumerate(targets):
+        longest = max(len(query), len(target))
+        if not longest:
+            return 1.0
+
+        if query in target:
+            # Substring: distance is exactly the number of inserted characters
+            ratio = len(query) / longest
+        else:
+            floor_ratio = max(min_ratio, best)
+            max_dist = int((1.0 - floor_ratio) * longest + 1e-9)
+            if (
+                target_masks
+                and (query_mask & ~target_masks[i]).bit_count() > max_dist
+            ):
+                continue
+            # Short tags only allow one or two edits, which the specialized
+            # versions check without a DP
+            if max_dist == 1:
+                dist = _lev_k1(query, target)
+            elif max_dist == 2:
+                dist = _lev_k2(query, target)
+            elif query_peq is not None:
+                dist = myers_levenshtein(query_peq, len(query), target, max_dist)
+            else:
+                dist = bounded_levenshtein(query, target, max_dist)
+            if dist > max_dist:
+                continue
+            ratio = 1.0 - dist / longest
+
+        if ratio > best:
+            best = ratio
+
+    return best if best >= min_ratio else 0.0
+
+
 def fuzzy_search(
-    query: str, candidates: List[str], threshold: float = 0.3
+    query: str,
+    candidates,
+    threshold: float = 0.3,
+    max_results: Optional[int] = None,
 ) -> List[Tuple[str, float]]:
     """
     Fuzzy search for matching strings with intelligent scoring
 
     Args:
         query: Search query
-        candidates: List of candidate strings
+        candidates: List of candidate strings, or a prebuilt FuzzySearchIndex
+            (preferred when the same candidates are searched repeatedly)
         threshold: Minimum similarity ratio (0-1) to include in results
+        max_results: If specified, only return the best N matches
 
     Returns:
         List of (candidate, similarity_score) tuples, sorted by score descending
     """
+    if isinstance(candidates, FuzzySearchIndex):
+        index = candidates
+    else:
+        index = FuzzySearchIndex(candidates)
+
     if not query:
-        return [(c, 1.0) for c in candidates]
+        return [(c, 1.0) for c in index.candidates[:max_results]]
 
-    results = []
     query_lower = query.lower()
+    fuzzy_min_ratio = max(threshold, FUZZY_MIN_RATIO)
 
     # Check if query has a category (contains colon)
     query_parts = query_lower.split(":", 1)
     query_has_category = len(query_parts) > 1
-    query_category = query_parts[0] if query_has_category else ""
+    query_category = sys.intern(query_parts[0]) if query_has_category else ""
     query_value = query_parts[1] if query_has_category else query_lower
-
-    for candidate in candidates:
-        candidate_lower = candidate.lower()
-
-        # Extract category and value from candidate
-        parts = candidate_lower.split(":", 1)
-        has_category = len(parts) > 1
-        category = parts[0] if has_category else ""
-        value_part = parts[1] if has_category else candidate_lower
-
-        # If query has a category, only match candidates from same category
-        if query_has_category and has_category:
-            if category != query_category:
-                continue  # Skip candidates from different categories
-            # Match on the value part only
-            match_target = value_part
-            query_match = query_value
-        elif query_has_category and not has_category:
-            # Query has category but candidate doesn't, skip
-            continue
+    query_match = query_value if query_has_category else query_lower
+    query_mask = _charmask(query_match)
+    query_peq = (
+        myers_pattern(query_match) if len(query_match) <= MYERS_MAX_QUERY else None
+    )
+
+    # Prefix hits score >= 1.5 and everything else scores below that, so when
+    # the prefix trie alone yields enough results the full scan is skipped
+    if max_results is not None:
+        # Ties keep id order, so besides the exact hits only the first
+        # max_results other prefix hits can make the cut
+        include_values = not query_has_category
+        exact_ids = index.exact_ids(query_lower, include_values)
+        prefix_ids = index.prefix_ids(
+            query_lower, include_values, max_results + len(exact_ids)
+        )
+        if exact_ids:
+            prefix_ids = sorted(set(prefix_ids).union(exact_ids))
+        if len(prefix_ids) >= max_results:
+            results = []
+            for i in prefix_ids:
+                if query_has_category and not index.has_category[i]:
+                    continue
+                exact = index.lower[i] == query_lower or (
+                    not query_has_category and index.values[i] == query_lower
+                )
+                ratio = 2.0 if exact else 1.5
+                if ratio >= threshold:
+                    results.append((index.candidates[i], ratio))
+            if len(results) >= max_results:
+                return heapq.nlargest(max_results, results, key=lambda x: x[1])
+
+    def score(ids, full_ratios=None, value_ratios=None):
+        """Tiered scores for the given candidate ids (in id order)"""
+        results = []
+        for i in ids:
+            candidate = index.candidates[i]
+            has_category = index.has_category[i]
+            value_part = index.values[i]
+
+            # If query has a category, only match candidates from same category
+            if query_has_category and has_category:
+                if index.categories[i] != query_category:
+                    continue  # Skip candidates from different categories
+                # Match on the value part only
+                targets = (value_part,)
+                target_masks = (index.value_charmasks[i],)
+            elif query_has_category and not has_category:
+                # Query has category but candidate doesn't, skip
+                continue
+            elif has_category:
+                # Query has no category, match against both full tag and value
+                targets = (index.lower[i], value_part)
+                target_masks = (index.charmasks[i], index.value_charmasks[i])
+            else:
+                targets = (index.lower[i],)
+                target_masks = (index.charmasks[i],)
+
+            # High priority: exact match
+            if query_match in targets:
+                ratio = 2.0
+            # High priority: starts with
+            elif any(t.startswith(query_match) for t in targets):
+                ratio = 1.5
+            # Medium priority: contains
+            elif any(query_match in t for t in targets):
+                similarity = _best_similarity(
+                    query_match, targets, 0.0, query_peq=query_peq
+                )
+                ratio = 1.0 + similarity * 0.5
+            # Low priority: fuzzy match only if ratio is good (>= 0.6)
+            elif value_ratios is not None:
+                ratio = value_ratios[i]
+                if full_ratios is not None and full_ratios[i] > ratio:
+                    ratio = full_ratios[i]
+                if not ratio:
+                    continue
+            else:
+                ratio = _best_similarity(
+                    query_match,
+                    targets,
+                    fuzzy_min_ratio,
+                    query_mask,
+                    target_masks,
+                    query_peq,
+                )
+                if not ratio:
+                    # Skip weak fuzzy matches
+                    continue
+
+            if ratio >= threshold:
+                results.append((candidate, ratio))
+        return results
+
+    # Every exact/prefix/substring hit scores above 1.0 and fuzzy-only matches
+    # score below it, so when enough candidates contain the query only those
+    # need scoring
+    substring_ids = None
+    if max_results is not None and len(query_match) >= 3:
+        substring_ids = index.substring_ids(query_match)
+        if len(substring_ids) >= max_results:
+            results = score(substring_ids)
+            if sum(1 for _, ratio in results if ratio > 1.0) >= max_results:
+                return heapq.nlargest(max_results, results, key=lambda x: x[1])
+
+    # Score every candidate in one compiled pass on large vocabularies; score()
+    # then only looks up the precomputed fuzzy ratios
+    full_ratios = value_ratios = None
+    kernel = _get_fuzzy_kernel() if len(index) >= KERNEL_MIN_CANDIDATES else None
+    if kernel is not None:
+        packed_full, packed_values = index.packed(kernel)
+        with _kernel_lock:
+            value_ratios = kernel.similarities(
+                packed_values, query_match, fuzzy_min_ratio
+            ).tolist()
+            if not query_has_category:
+                full_ratios = kernel.similarities(
+                    packed_full, query_match, fuzzy_min_ratio
+                ).tolist()
+
+    # Only candidates containing the query or within fuzzy reach of it can
+    # score, so the rest are not visited
+    ids = range(len(index))
+    if len(query_match) >= 3:
+        if substring_ids is None:
+            substring_ids = index.substring_ids(query_match)
+        if kernel is not None:
+            reachable = [i for i, ratio in enumerate(value_ratios) if ratio]
+            if full_ratios is not None:
+                reachable += [i for i, ratio in enumerate(full_ratios) if ratio]
         else:
-            # Query doesn't have category, match against both full tag and value
-            match_target = candidate_lower
-            query_match = query_lower
-
-        # Calculate similarity ratio
-        ratio = SequenceMatcher(None, query_match, match_target).ratio()
-
-        # Also check value part separately if not already doing so
-        if not query_has_category and has_category:
-            value_ratio = SequenceMatcher(None, query_match, value_part).ratio()
-            ratio = max(ratio, value_ratio)
-
-        # High priority: exact match
-        if query_match == match_target or (
-            not query_has_category and query_match == value_part
-        ):
-            ratio = 2.0
-        # High priority: starts with
-        elif match_target.startswith(query_match) or (
-            not query_has_category and value_part.startswith(query_match)
-        ):
-            ratio = 1.5
-        # Medium priority: contains
-        elif query_match in match_target or (
-            not query_has_category and query_match in value_part
-        ):
-            ratio = 1.0 + ratio * 0.5
-        # Low priority: fuzzy match only if ratio is good (>= 0.6)
-        elif ratio < 0.6:
-            # Skip weak fuzzy matches
-            continue
-
-        if ratio >= threshold:
-            results.append((candidate, ratio))
-
-    # Sort by score descending
+            reachable = index.length_band_ids(
+                len(query_match), fuzzy_min_ratio, not query_has_category
+            )
+        ids = sorted(set(substring_ids).union(reachable))
+
+    results = score(ids, full_ratios, value_ratios)
+
+    # Sort by score descending (partial selection when only the top N is needed)
+    if max_results is not None:
+        return heapq.nlargest(max_results, results, key=lambda x: x[1])
     results.sort(key=lambda x: x[1], reverse=True)
     return results
 
@@ -5,7 +5,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import json
-from src.data_models import Tag, ImageData, GlobalConfig, ProjectData
+from src.data_models import Tag, TagList, ImageData, ImageList, GlobalConfig, ProjectData
 
 
 def test_tag():
@@ -55,6 +55,129 @@ def test_image_data():
         temp_path.unlink()
 
 
+def test_image_data_tag_str_set():
+    """Test cached tag string set stays in sync with tag edits"""
+    img_data = ImageData(name="test")
+    img_data.add_tag("setting", "mountain")
+    assert img_data.tag_str_set == {"setting:mountain"}
+
+    # Updated by add_tag/remove_tag, keeping duplicates
+    img_data.add_tag("camera", "from front")
+    img_data.add_tag("camera", "from front")
+    assert "camera:from front" in img_data.tag_str_set
+    img_data.remove_tag(Tag("camera", "from front"))
+    assert "camera:from front" in img_data.tag_str_set
+    img_data.remove_tag(Tag("camera", "from front"))
+    assert img_data.tag_str_set == {"setting:mountain"}
+
+    # Direct edits need an explicit invalidation
+    img_data.tags[0] = Tag("setting", "beach")
+    img_data.invalidate_tag_cache()
+    assert img_data.tag_str_set == {"setting:beach"}
+
+
+def test_image_data_find_tag():
+    """Test cached lookup of tags by string"""
+    img_data = ImageData(name="test")
+    img_data.add_tag("setting", "mountain")
+    assert img_data.find_tag("setting:mountain") is img_data.tags[0]
+    assert img_data.find_tag("setting:beach") is None
+
+    img_data.add_tag("setting", "beach")
+    assert img_data.find_tag("setting:beach") is img_data.tags[1]
+
+    img_data.remove_tag(Tag("setting", "mountain"))
+    assert img_data.find_tag("setting:mountain") is None
+
+
+def test_image_data_replace_tag():
+    """Test in-place tag replacement with duplicates"""
+    img_data = ImageData(name="test")
+    img_data.add_tag("setting", "mountain")
+    img_data.add_tag("camera", "front")
+    img_data.add_tag("setting", "mountain")
+
+    assert img_data.replace_tag(Tag("setting", "mountain"), Tag("setting", "lake"))
+    assert [str(t) for t in img_data.tags] == [
+        "setting:lake", "camera:front", "setting:mountain"
+    ]
+    assert "setting:mountain" in img_data.tag_str_set
+
+    assert img_data.replace_tag(Tag("setting", "mountain"), Tag("setting", "lake"))
+    assert img_data.tags[2] == Tag("setting", "lake")
+    assert not img_data.replace_tag(Tag("setting", "mountain"), Tag("setting", "lake"))
+
+    assert img_data.remove_tag(Tag("setting", "lake"))
+    assert not img_data.remove_tag(Tag("class", "person"))
+    assert img_data.replace_tag(Tag("setting", "lake"), Tag("class", "person"))
+    assert [str(t) for t in img_data.tags] == ["camera:front", "class:person"]
+
+
+def test_tag_list():
+    """Test sorted tag lists and the change counter"""
+    tag_list = TagList()
+    tag_list.add_tag("setting", "mountain")
+    tag_list.add_tag("camera", "front")
+    tag_list.add_tag("setting", "beach")
+    assert tag_list.get_all_full_tags() == [
+        "camera:front", "setting:beach", "setting:mountain"
+    ]
+    assert tag_list.get_all_categories() == ["camera:", "setting:"]
+
+    version = tag_list.version
+    tag_list.add_tag("setting", "beach")
+    assert tag_list.version == version
+
+    tag_list.remove_tag("setting", "beach")
+    assert tag_list.get_all_categories() == ["camera:", "setting:"]
+    tag_list.remove_tag("setting", "mountain")
+    assert tag_list.get_all_tags() == ["camera:", "camera:front"]
+    assert tag_list.version > version
+
+
+def test_image_list_get_index():
+    """Test path positions stay correct as the list changes"""
+    base = Path("/tmp/project")
+    paths = [base / f"img{i}.png" for i in range(4)]
+    image_list = ImageList.create_filtered(base, paths)
+    assert image_list.get_index(paths[2]) == 2
+    assert image_list[2] == paths[2]
+
+    image_list.remove_image(paths[0])
+    assert image_list.get_index(paths[0]) is None
+    assert image_list.get_index(paths[3]) == 2
+
+    image_list.update_image_path(paths[1], base / "renamed.png")
+    assert image_list.get_index(base / "renamed.png") == 0
+
+    image_list.set_order([paths[3], paths[2], base / "renamed.png"])
+    assert image_list.get_index(paths[3]) == 0
+    assert image_list.add_image(paths[0])
+    assert image_list.get_index(paths[0]) == 3
+    assert not image_list.add_image(paths[0])
+
+
+def test_image_list_update_filtered_paths():
+    """Test a filtered view can be refilled in place"""
+    base = Path("/tmp/project")
+    paths = [base / f"img{i}.png" for i in range(4)]
+    view = ImageList.create_filtered(base, paths[:3])
+    view.select(paths[0])
+    view.select(paths[1])
+    view.set_active(paths[1])
+
+    view.update_filtered_paths([paths[3], paths[1]])
+    assert view.get_all_paths() == [paths[3], paths[1]]
+    assert view.get_index(paths[1]) == 1
+    assert view.get_selected() == [paths[1]]
+    assert view.get_active() == paths[1]
+    assert not view.is_dirty()
+
+    view.update_filtered_paths([])
+    assert len(view) == 0
+    assert view.get_active() is None
+
+
 def test_global_config():
     """Test GlobalConfig model"""
     config = GlobalConfig(
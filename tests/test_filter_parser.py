@@ -2,7 +2,7 @@
 Tests for the filter parser
 """
 import pytest
-from src.filter_parser import parse_filter, evaluate_filter, FilterParser
+from src.filter_parser import parse_filter, evaluate_filter, compile_filter, constant_result, literal_alternatives, FilterParser
 
 
 def test_exact_match():
@@ -205,5 +205,61 @@ def test_operator_precedence():
     assert evaluate_filter('class:ocean AND setting:mountain OR meta:deleted', tags) == False
 
 
+def test_constant_result():
+    """Test detection of filters that do not depend on the tags"""
+    assert constant_result(parse_filter('*')) is True
+    assert constant_result(parse_filter('')) is True
+    assert constant_result(parse_filter('NOT *')) is False
+    assert constant_result(parse_filter('* OR class:lake')) is True
+    assert constant_result(parse_filter('NOT * AND class:lake')) is False
+
+    # Depends on the tags
+    assert constant_result(parse_filter('class:*')) is None
+    assert constant_result(parse_filter('* AND class:lake')) is None
+    assert constant_result(parse_filter('NOT * OR class:lake')) is None
+
+
+def test_compile_filter():
+    """Test compiled predicates agree with evaluating the parsed tree"""
+    tag_lists = [
+        [],
+        ['class:lake'],
+        ['Class:Lakeside', 'setting:mountain'],
+        ['class:river', 'meta:deleted', 'setting:big lake'],
+    ]
+    expressions = [
+        'class:lake',
+        'class:lake*',
+        'CLASS:*SIDE',
+        '*',
+        'NOT meta:deleted',
+        '(class:lake OR class:river) AND NOT meta:deleted',
+        '"setting:big lake" OR setting:mountain',
+    ]
+    for expression in expressions:
+        predicate = compile_filter(expression)
+        tree = parse_filter(expression)
+        for tags in tag_lists:
+            assert predicate(tags) == tree.evaluate(tags)
+
+    # Invalid expressions still raise
+    with pytest.raises(ValueError):
+        compile_filter('class:lake AND')
+
+
+def test_literal_alternatives():
+    """Test detection of OR-of-exact-tags filters"""
+    assert literal_alternatives(parse_filter('class:lake')) == ['class:lake']
+    assert literal_alternatives(
+        parse_filter('Class:Lake OR "setting:big lake" OR camera:front')
+    ) == ['class:lake', 'setting:big lake', 'camera:front']
+
+    # Any other shape
+    assert literal_alternatives(parse_filter('class:*')) is None
+    assert literal_alternatives(parse_filter('class:lake OR class:*')) is None
+    assert literal_alternatives(parse_filter('class:lake AND class:river')) is None
+    assert literal_alternatives(parse_filter('NOT class:lake')) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
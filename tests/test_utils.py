@@ -5,7 +5,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import hashlib
-from src.utils import hash_image, fuzzy_search, parse_filter_expression, parse_export_template, apply_export_template
+from src.utils import hash_image, fuzzy_search, FuzzySearchIndex, bounded_levenshtein, myers_levenshtein, myers_pattern, parse_filter_expression, parse_export_template, apply_export_template
 from src.data_models import ImageData, Tag
 
 
@@ -58,6 +58,85 @@ def test_fuzzy_search():
     assert len(results) == len(candidates)
 
 
+def test_fuzzy_search_index_length_band():
+    """Test only candidates within fuzzy reach of the query length are kept"""
+    index = FuzzySearchIndex(["class:a", "class:mount", "mountains", "m" * 20])
+    # 5 characters at ratio 0.6 reach lengths 3 to 8
+    assert index.length_band_ids(5, 0.6, include_full=False) == [1]
+    assert index.length_band_ids(5, 0.6) == [0, 1]
+    assert index.length_band_ids(9, 0.6, include_full=False) == [2]
+
+
+def test_fuzzy_search_index_prefix_ids():
+    """Test trie lookups for prefix and exact hits"""
+    index = FuzzySearchIndex(["camera:cam", "cam", "class:camp", "camera:front"])
+    assert index.prefix_ids("cam") == [0, 1, 2, 3]
+    assert index.prefix_ids("cam", limit=2) == [0, 1]
+    assert index.prefix_ids("cam", include_values=False) == [0, 1, 3]
+    assert index.exact_ids("cam") == [0, 1]
+    assert index.exact_ids("cam", include_values=False) == [1]
+
+
+def test_bounded_levenshtein():
+    """Test bounded edit distance"""
+    assert bounded_levenshtein("mountain", "mountain", 2) == 0
+    assert bounded_levenshtein("mountian", "mountain", 2) == 2
+    assert bounded_levenshtein("beach", "bench", 1) == 1
+    assert bounded_levenshtein("", "abc", 3) == 3
+
+    # Distances above the bound are reported as max_dist + 1
+    assert bounded_levenshtein("mountain", "beach", 2) == 3
+    assert bounded_levenshtein("a", "abcdef", 2) == 3
+
+
+def test_myers_levenshtein():
+    """Test bit-parallel edit distance agrees with the banded DP"""
+    words = ["mountain", "mountian", "beach", "bench", "", "a", "lakeside", "lake"]
+    for query in ["mountain", "bech", "lake", "a"]:
+        peq = myers_pattern(query)
+        for word in words:
+            for max_dist in range(4):
+                assert myers_levenshtein(
+                    peq, len(query), word, max_dist
+                ) == bounded_levenshtein(query, word, max_dist)
+
+
+def test_fuzzy_kernel_matches_python():
+    """Test compiled kernel agrees with bounded_levenshtein"""
+    fuzzy_kernel = pytest.importorskip("src.fuzzy_kernel")
+
+    targets = ["mountain", "mountian", "beach", "bench", "", "montaña", "mount"]
+    packed = fuzzy_kernel.encode_strings(targets)
+    for query in ["mountain", "bech", "montana", "m"]:
+        ratios = fuzzy_kernel.similarities(packed, query, 0.6)
+        for target, ratio in zip(targets, ratios):
+            longest = max(len(query), len(target))
+            max_dist = int(0.4 * longest + 1e-9)
+            dist = bounded_levenshtein(query, target, max_dist)
+            expected = 1.0 - dist / longest if dist <= max_dist else 0.0
+            assert ratio == pytest.approx(expected)
+
+
+def test_fuzzy_rapidfuzz_matches_python():
+    """Test RapidFuzz backend agrees with bounded_levenshtein"""
+    fuzzy_rapidfuzz = pytest.importorskip("src.fuzzy_rapidfuzz")
+
+    targets = ["mountain", "mountian", "beach", "bench", "", "montaña", "mount"]
+    packed = fuzzy_rapidfuzz.encode_strings(targets)
+    for query in ["mountain", "bech", "montana", "m", "abc"]:
+        for min_ratio in (0.3, 0.6, 1.5):
+            ratios = fuzzy_rapidfuzz.similarities(packed, query, min_ratio)
+            for target, ratio in zip(targets, ratios):
+                longest = max(len(query), len(target))
+                if not longest:
+                    assert ratio == 1.0
+                    continue
+                max_dist = int((1.0 - min_ratio) * longest + 1e-9)
+                dist = bounded_levenshtein(query, target, max_dist)
+                expected = 1.0 - dist / longest if dist <= max_dist else 0.0
+                assert ratio == pytest.approx(expected)
+
+
 def test_parse_filter_expression():
     """Test filter expression parsing"""
     # Simple AND